@@ -0,0 +1,406 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cache import DEFAULT_MAX_BYTES, DiskCache, types_key
+from fileio import atomic_write, find_java_files
+from profiling import PROFILE_MODES, profile_call
+from project import DEFAULT_INDEX_NAME, SymbolIndex
+from rules import RULE_STAT_FIELDS, RuleStats
+from sourcemap import SOURCE_MAP_SUFFIX, SourceMap
+from translator import PARALLEL_MIN_METHODS, JavaToGoEngine, TranslationOptions, TranslationTimeout, time_limit
+
+# Default per-file time limit in seconds
+DEFAULT_TIMEOUT = 60
+
+# Files at least this big are memory-mapped and scanned as bytes instead of decoded
+MMAP_MIN_BYTES = 256 * 1024
+
+# Files at least this big are translated class by class (bytes)
+DEFAULT_STREAM_BYTES = 16 * 1024 * 1024
+
+# {class name: kind} of the project being translated, set once per worker process
+project_types = {}
+
+
+def set_project_types(types):
+    """Pool initializer: share the project's type table with a worker"""
+    global project_types
+    project_types = types
+
+
+def output_path_for(java_path, src_dir, out_dir):
+    """Mirror the package layout of java_path below out_dir as a .go file"""
+    relative_path = os.path.relpath(java_path, src_dir)
+    return os.path.join(out_dir, os.path.splitext(relative_path)[0] + ".go")
+
+
+def translate_file(job):
+    """Translate a single Java file and write the Go output (runs in a worker)
+
+    Returns (java_path, error, cache_hit, report) where cache_hit is None
+    when no disk cache is in use and report is the engine's timing report,
+    or None when the file was not translated. profile is None or a
+    (mode, output_path) pair for profile_call. Files of at least
+    stream_bytes are streamed with stream_file() and bypass the disk cache.
+    With source_map set the Java line map is written next to the Go file.
+    method_jobs is the engine's jobs: processes for the methods of a large class.
+    With rule_stats set the report includes the engine's per-rule statistics.
+    """
+    (java_path, go_path, options, timeout, cache_dir, profile, stream_bytes, source_map, method_jobs,
+     rule_stats) = job
+    cache_hit = None
+    report = None
+    try:
+        if stream_bytes is not None and os.path.getsize(java_path) >= stream_bytes:
+            engine = JavaToGoEngine(options, types=project_types, jobs=method_jobs,
+                                    rule_stats=RuleStats() if rule_stats else None)
+            with time_limit(timeout):
+                stream_file(engine, java_path, go_path)
+            if source_map:
+                engine.source_map.save(go_path + SOURCE_MAP_SUFFIX, java_path)
+            return java_path, None, None, engine.translation_report()
+
+        source = read_source(java_path)
+        try:
+            go_code = None
+            line_map = None
+            if cache_dir:
+                disk_cache = DiskCache(cache_dir)
+                key = disk_cache.key(source, options, types_key(project_types) if project_types else "")
+                go_code = disk_cache.get(key)
+                if go_code is not None and source_map:
+                    # The map is cached next to the code; without it the file is translated again
+                    map_json = disk_cache.get(key, SOURCE_MAP_SUFFIX)
+                    if map_json is None:
+                        go_code = None
+                    else:
+                        line_map = SourceMap.from_dict(json.loads(map_json))
+                cache_hit = go_code is not None
+
+            if go_code is None:
+                # Mapped files are scanned as bytes; only emitted pieces get decoded
+                java_code = source if isinstance(source, mmap.mmap) else source.decode('utf-8', errors='replace')
+                engine = JavaToGoEngine(options, types=project_types, jobs=method_jobs,
+                                    rule_stats=RuleStats() if rule_stats else None)
+                with time_limit(timeout):
+                    if profile:
+                        mode, profile_path = profile
+                        os.makedirs(os.path.dirname(profile_path) or ".", exist_ok=True)
+                        go_code = profile_call(lambda: engine.translate(java_code), mode, profile_path)
+                    else:
+                        go_code = engine.translate(java_code)
+                report = engine.translation_report()
+                line_map = engine.source_map
+                if cache_dir:
+                    disk_cache.put(key, go_code)
+                    disk_cache.put(key, json.dumps(line_map.as_dict(), separators=(",", ":")), SOURCE_MAP_SUFFIX)
+        finally:
+            if isinstance(source, mmap.mmap):
+                source.close()
+
+        with atomic_write(go_path) as file:
+            file.write(go_code)
+        if source_map:
+            line_map.save(go_path + SOURCE_MAP_SUFFIX, java_path)
+        return java_path, None, cache_hit, report
+    except TranslationTimeout:
+        return java_path, "timed out", cache_hit, None
+    except Exception as e:
+        return java_path, str(e), cache_hit, None
+
+
+def read_source(java_path):
+    """Return a read-only mmap of a large file, or the bytes of a small one"""
+    with open(java_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size >= MMAP_MIN_BYTES:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return file.read()
+
+
+def stream_file(engine, java_path, go_path):
+    """Translate java_path type by type and write the Go code to go_path
+
+    The code goes to a temporary file that replaces go_path once complete.
+    """
+    with open(java_path, 'r', encoding='utf-8', errors='replace', newline='') as source:
+        with atomic_write(go_path) as target:
+            for go_code in engine.translate_stream(source):
+                target.write(go_code)
+
+
+def profile_path_for(java_path, src_dir, profile_dir):
+    """Mirror the package layout of java_path below profile_dir as a .prof file"""
+    relative_path = os.path.relpath(java_path, src_dir)
+    return os.path.join(profile_dir, os.path.splitext(relative_path)[0] + ".prof")
+
+
+def run_batch(src, out_dir, jobs=None, options=None, timeout=DEFAULT_TIMEOUT,
+              cache_dir=None, cache_max_bytes=DEFAULT_MAX_BYTES, profile_mode=None, profile_dir=None,
+              types=None, stream_bytes=DEFAULT_STREAM_BYTES, source_maps=False, method_jobs=None,
+              rule_stats=False):
+    """Translate a file or a whole source tree and return a summary dict
+
+    With profile_mode set every translation runs under profile_call and its
+    dump is written below profile_dir. types is the {class name: kind}
+    table of a project's SymbolIndex, used to resolve classes declared in
+    other files. Files of at least stream_bytes (None: never) are translated
+    one type declaration at a time to bound memory use. With source_maps
+    every .go file gets a .go.map sidecar mapping its lines to Java lines.
+    method_jobs is the number of processes that convert the methods of one
+    large class; None uses jobs for a single file and 1 for a tree, where
+    the files already keep the workers busy. With rule_stats the summary's
+    rule_stats is a RuleStats summed over every translated file (files
+    served from the cache run no rules).
+    """
+    options = options or TranslationOptions()
+    if os.path.isfile(src):
+        src_dir = os.path.dirname(src)
+        java_files = [src]
+    else:
+        src_dir = src
+        java_files = find_java_files(src)
+
+    def profile_for(path):
+        if not profile_mode:
+            return None
+        return profile_mode, profile_path_for(path, src_dir, profile_dir or out_dir)
+
+    jobs = jobs or os.cpu_count() or 1
+    if method_jobs is None:
+        method_jobs = jobs if len(java_files) == 1 else 1
+    work = [
+        (path, output_path_for(path, src_dir, out_dir), options, timeout, cache_dir, profile_for(path), stream_bytes,
+         source_maps, method_jobs, rule_stats)
+        for path in java_files
+    ]
+
+    start = time.perf_counter()
+    if jobs == 1 or len(work) <= 1:
+        # Not worth paying for process start-up
+        set_project_types(types or {})
+        results = [translate_file(job) for job in work]
+    else:
+        # Hand out work in chunks so per-file dispatch overhead stays small
+        chunksize = max(1, len(work) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=set_project_types, initargs=(types or {},)) as executor:
+            results = list(executor.map(translate_file, work, chunksize=chunksize))
+
+    evicted = 0
+    if cache_dir:
+        evicted = DiskCache(cache_dir, cache_max_bytes).evict()
+    elapsed = time.perf_counter() - start
+
+    failures = [(path, error) for path, error, _, _ in results if error is not None]
+    reports = {path: report for path, _, _, report in results if report is not None}
+    phases = {}
+    rule_totals = RuleStats() if rule_stats else None
+    for report in reports.values():
+        for name, seconds in report["phases"].items():
+            phases[name] = phases.get(name, 0.0) + seconds
+        # Per-file rows are only kept in the totals
+        rows = report.pop("rules", None)
+        if rows and rule_totals is not None:
+            rule_totals.merge(rows)
+    return {
+        "files": len(work),
+        "translated": len(work) - len(failures),
+        "failures": failures,
+        "timed_out": sum(1 for _, error in failures if error == "timed out"),
+        "seconds": elapsed,
+        "files_per_sec": len(work) / elapsed if elapsed > 0 else 0.0,
+        "jobs": jobs,
+        "cache_hits": sum(1 for _, _, hit, _ in results if hit),
+        "cache_misses": sum(1 for _, _, hit, _ in results if hit is False),
+        "cache_evicted": evicted if cache_dir else None,
+        "phases": phases,
+        "reports": reports,
+        "rule_stats": rule_totals,
+    }
+
+
+def write_report(summary, report_path):
+    """Write the per-file timing reports and the phase totals as JSON ('-' is stdout)"""
+    report = {
+        "files": summary["files"],
+        "seconds": summary["seconds"],
+        "phases": summary["phases"],
+        "reports": summary["reports"],
+    }
+    if report_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    with open(report_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+
+def write_rule_stats(stats, path):
+    """Write per-rule statistics as CSV when path ends in .csv, otherwise as JSON ('-' is stdout)"""
+    rows = stats.as_rows()
+    if path.endswith(".csv"):
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=RULE_STAT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+    if path == "-":
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+        return
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(rows, file, indent=2)
+
+
+def print_summary(summary, stream=sys.stdout):
+    """Print a human readable summary of a batch run"""
+    print(f"Translated {summary['translated']}/{summary['files']} files "
+          f"in {summary['seconds']:.2f}s ({summary['files_per_sec']:.1f} files/sec, "
+          f"{summary['jobs']} jobs)", file=stream)
+    if summary["cache_evicted"] is not None:
+        print(f"Cache: {summary['cache_hits']} hits, {summary['cache_misses']} misses, "
+              f"{summary['cache_evicted']} evicted", file=stream)
+    if summary["failures"]:
+        print(f"{len(summary['failures'])} failed ({summary['timed_out']} timed out):", file=stream)
+        for path, error in summary["failures"]:
+            print(f"  {path}: {error}", file=stream)
+    if summary["phases"]:
+        slowest = sorted(summary["phases"].items(), key=lambda item: item[1], reverse=True)[:3]
+        print("Slowest phases: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in slowest), file=stream)
+    if summary["rule_stats"]:
+        unmatched = summary["rule_stats"].unmatched()
+        print(f"Rules: {len(summary['rule_stats'])} tracked, {len(unmatched)} never matched", file=stream)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py translate",
+        description="Translate a Java file or source tree to Go without the GUI"
+    )
+    parser.add_argument("src", help="Java file or directory to translate")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Directory for the generated .go files, or - to write a single file to stdout")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--method-jobs", type=int, default=None, metavar="N",
+                        help=f"Processes converting the methods of a class with {PARALLEL_MIN_METHODS} or more "
+                             "(default: --jobs for a single file, 1 for a tree)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Per-file time limit in seconds, 0 for none (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Reuse translations of unchanged files from this directory")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="Size limit of the cache directory in MB (default: %(default)s)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Translate every file one type declaration at a time")
+    parser.add_argument("--stream-above", type=int, default=DEFAULT_STREAM_BYTES // (1024 * 1024), metavar="MB",
+                        help="Stream files of at least this many MB (default: %(default)s)")
+    parser.add_argument("--project", action="store_true",
+                        help="Index every class in the source tree first and resolve types across files")
+    parser.add_argument("--index", default=None, metavar="FILE",
+                        help=f"Symbol index file for --project (default: OUTPUT/{DEFAULT_INDEX_NAME})")
+    parser.add_argument("--source-map", action="store_true",
+                        help=f"Write a FILE.go{SOURCE_MAP_SUFFIX} sidecar mapping each Go line to its Java lines")
+    parser.add_argument("--report", default=None, metavar="FILE",
+                        help="Write per-file phase timings as JSON to FILE ('-' for stdout)")
+    parser.add_argument("--rule-stats", default=None, metavar="FILE",
+                        help="Count matches and time every rewrite rule; write them to FILE as JSON, "
+                             "or CSV if FILE ends in .csv ('-' for stdout)")
+    parser.add_argument("--profile", choices=PROFILE_MODES, default=None,
+                        help="Profile every translation with cProfile or tracemalloc")
+    parser.add_argument("--profile-dir", default=None,
+                        help="Directory for the profile dumps (default: the output directory)")
+    add_option_arguments(parser)
+    return parser
+
+
+def add_option_arguments(parser):
+    """Add the translation option flags shared by the headless commands"""
+    parser.add_argument("--no-comments", action="store_true", help="Do not keep comments")
+    parser.add_argument("--no-pointers", action="store_true", help="Do not use pointers for structs")
+    parser.add_argument("--no-capitalize", action="store_true", help="Do not capitalize exported fields")
+
+
+def options_from_args(args):
+    return TranslationOptions(
+        keep_comments=not args.no_comments,
+        use_pointers=not args.no_pointers,
+        capitalize_fields=not args.no_capitalize
+    )
+
+
+def main(argv=None):
+    """Entry point for the headless translate command"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.output == "-":
+        # These all write files next to (or about) the output, which -o - does not have
+        unsupported = [flag for flag, value in (
+            ("--cache-dir", args.cache_dir), ("--source-map", args.source_map), ("--report", args.report),
+            ("--rule-stats", args.rule_stats), ("--profile", args.profile), ("--profile-dir", args.profile_dir),
+        ) if value]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be used with -o -")
+    if not os.path.exists(args.src):
+        print(f"No such file or directory: {args.src}", file=sys.stderr)
+        return 2
+
+    options = options_from_args(args)
+    types = None
+    if args.project:
+        src_dir = args.src if os.path.isdir(args.src) else os.path.dirname(args.src) or "."
+        index_path = args.index or os.path.join(src_dir if args.output == "-" else args.output, DEFAULT_INDEX_NAME)
+        start = time.perf_counter()
+        index = SymbolIndex.load(index_path)
+        counts = index.update(src_dir, jobs=args.jobs)
+        index.save(index_path)
+        print(f"Indexed {len(index)} types ({counts['indexed']} files parsed, {counts['unchanged']} unchanged, "
+              f"{counts['removed']} removed) in {time.perf_counter() - start:.2f}s",
+              file=sys.stderr if "-" in (args.report, args.output) else sys.stdout)
+        types = index.type_kinds()
+    
+    # A single file can be streamed straight to stdout (or a pipe or socket)
+    if args.output == "-":
+        if not os.path.isfile(args.src):
+            print("-o - needs a single Java file", file=sys.stderr)
+            return 2
+        engine = JavaToGoEngine(options, types=types, jobs=args.method_jobs or args.jobs or os.cpu_count())
+        # Failures are reported like a failed file in a batch run, on stderr since stdout carries the code
+        error = None
+        try:
+            with open(args.src, 'r', encoding='utf-8', errors='replace', newline='') as source:
+                with time_limit(args.timeout):
+                    for go_code in engine.translate_stream(source):
+                        sys.stdout.write(go_code)
+        except TranslationTimeout:
+            error = "timed out"
+        except Exception as e:
+            error = str(e)
+        if error is not None:
+            print(f"1 failed ({1 if error == 'timed out' else 0} timed out):", file=sys.stderr)
+            print(f"  {args.src}: {error}", file=sys.stderr)
+            return 1
+        return 0
+    
+    summary = run_batch(
+        args.src, args.output, jobs=args.jobs, options=options, timeout=args.timeout,
+        cache_dir=args.cache_dir, cache_max_bytes=args.cache_size * 1024 * 1024,
+        profile_mode=args.profile, profile_dir=args.profile_dir, types=types,
+        stream_bytes=0 if args.stream else args.stream_above * 1024 * 1024,
+        source_maps=args.source_map, method_jobs=args.method_jobs, rule_stats=bool(args.rule_stats)
+    )
+    print_summary(summary, stream=sys.stderr if "-" in (args.report, args.rule_stats) else sys.stdout)
+    if args.report:
+        write_report(summary, args.report)
+    if args.rule_stats:
+        write_rule_stats(summary["rule_stats"], args.rule_stats)
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from translator import JavaToGoEngine
+
+# Where save/compare look for stored results by default
+DEFAULT_BASELINE = "benchmark_baseline.json"
+
+# Allowed slowdown against the baseline before a case counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# name -> generate_java_class() arguments
+BENCHMARK_CASES = {
+    "small_class": dict(fields=5, methods=5, body_lines=5),
+    "medium_class": dict(fields=50, methods=100, body_lines=10),
+    "large_class": dict(fields=200, methods=1000, body_lines=20),
+    "long_methods": dict(fields=10, methods=20, body_lines=2000),
+    "nested_loops": dict(fields=10, methods=200, body_lines=10, nesting=6),
+    "string_heavy": dict(fields=20, methods=300, body_lines=15, strings=True),
+    "deep_nesting": dict(fields=5, methods=50, body_lines=5, nesting=40),
+}
+
+
+def generate_java_class(fields, methods, body_lines, nesting=0, strings=False, name="Generated"):
+    """Build a synthetic Java class of the given size
+
+    Each method body has body_lines statements wrapped in nesting levels of
+    loops/ifs; strings=True makes most statements string concatenations and
+    string method calls.
+    """
+    types = ["int", "String", "double", "boolean", "long"]
+    lines = [f"public class {name} {{"]
+    for i in range(fields):
+        lines.append(f"    private {types[i % len(types)]} field{i};")
+    lines.append("")
+
+    for m in range(methods):
+        lines.append(f"    public int method{m}(int a, String s) {{")
+        indent = "        "
+        for level in range(nesting):
+            if level % 2:
+                lines.append(f"{indent}for (int i{level} = 0; i{level} < a; i{level}++) {{")
+            else:
+                lines.append(f"{indent}if (a > {level}) {{")
+            indent += "    "
+        for line in range(body_lines):
+            field = f"field{line % fields}" if fields else "a"
+            if strings and line % 4 != 3:
+                statement = [
+                    f'System.out.println("value " + s + " at {line}");',
+                    f'String t{line} = s.toLowerCase() + "-{line}";',
+                    f'boolean same{line} = s.equals("{line}");',
+                ][line % 3]
+            else:
+                statement = [
+                    f"int v{line} = a + {line};",
+                    f"this.{field} = a;",
+                    f'System.out.println("line {line}: " + a);',
+                    f"a = a * {line % 7 + 1};",
+                ][line % 4]
+            lines.append(indent + statement)
+        for level in range(nesting):
+            indent = indent[:-4]
+            lines.append(f"{indent}}}")
+        lines.append("        return a;")
+        lines.append("    }")
+        lines.append("")
+
+    lines.append("    public static void main(String[] args) {")
+    lines.append(f'        System.out.println("{name}");')
+    lines.append("    }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def best_time(function, repeat):
+    """Return the fastest of repeat runs of function() and its last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def peak_memory(function):
+    """Return the peak traced memory in bytes while running function()"""
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(java_code, repeat):
+    """Benchmark translation and formatting of one generated source"""
+    engine = JavaToGoEngine()
+    lines = java_code.count("\n")
+    megabytes = len(java_code.encode()) / (1024 * 1024)
+
+    translate_seconds, go_code = best_time(lambda: engine.translate(java_code), repeat)
+    phases = dict(engine.timer.totals)
+    format_seconds, _ = best_time(lambda: engine.format_go(go_code), repeat)
+
+    return {
+        "lines": lines,
+        "bytes": len(java_code.encode()),
+        "translate_seconds": translate_seconds,
+        "format_seconds": format_seconds,
+        "lines_per_sec": lines / translate_seconds,
+        "mb_per_sec": megabytes / translate_seconds,
+        "format_lines_per_sec": go_code.count("\n") / format_seconds if format_seconds else 0.0,
+        "peak_memory_bytes": peak_memory(lambda: engine.translate(java_code)),
+        "phase_seconds": phases,
+    }
+
+
+def run_benchmarks(case_names=None, repeat=3):
+    results = {}
+    for name, sizes in BENCHMARK_CASES.items():
+        if case_names and name not in case_names:
+            continue
+        results[name] = run_case(generate_java_class(**sizes), repeat)
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Return a list of regression messages for results that fell behind baseline"""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        for metric in ("lines_per_sec", "format_lines_per_sec"):
+            if expected.get(metric) and result[metric] < expected[metric] * (1 - tolerance):
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.0f} is more than {tolerance:.0%} "
+                    f"below the baseline {expected[metric]:.0f}"
+                )
+        if expected.get("peak_memory_bytes") and result["peak_memory_bytes"] > expected["peak_memory_bytes"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak memory {result['peak_memory_bytes'] / 1024:.0f} KiB is more than "
+                f"{tolerance:.0%} above the baseline {expected['peak_memory_bytes'] / 1024:.0f} KiB"
+            )
+    return regressions
+
+
+def print_results(results, stream=sys.stdout):
+    print(f"{'case':<14} {'lines':>8} {'lines/s':>10} {'MB/s':>7} {'fmt lines/s':>12} {'peak KiB':>9}", file=stream)
+    for name, result in results.items():
+        print(f"{name:<14} {result['lines']:>8} {result['lines_per_sec']:>10.0f} {result['mb_per_sec']:>7.2f} "
+              f"{result['format_lines_per_sec']:>12.0f} {result['peak_memory_bytes'] / 1024:>9.0f}", file=stream)
+    print(file=stream)
+    for name, result in results.items():
+        slowest = sorted(result["phase_seconds"].items(), key=lambda item: item[1], reverse=True)[:3]
+        print(f"{name:<14} " + ", ".join(f"{phase} {seconds * 1000:.1f}ms" for phase, seconds in slowest), file=stream)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py benchmark",
+        description="Benchmark the translator on generated Java sources"
+    )
+    parser.add_argument("--case", action="append", choices=sorted(BENCHMARK_CASES),
+                        help="Only run this case (can be given more than once)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest counts (default: 3)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help=f"Baseline file (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed regression as a fraction (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    return parser
+
+
+def main(argv=None):
+    """Run the benchmarks; exit status 1 means a regression against the baseline, 2 a missing baseline"""
+    args = build_parser().parse_args(argv)
+    # Without a baseline there is nothing to gate on, so fail before spending time on the runs
+    if not args.save_baseline and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one", file=sys.stderr)
+        return 2
+    results = run_benchmarks(args.case, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import re
+from array import array
+from bisect import bisect_left
+
+# Tokens that can hide braces (strings, text blocks, char literals, comments) plus the braces themselves
+BRACE_TOKEN_PATTERN = re.compile(
+    r'"""(?:\\[\s\S]|[^\\])*?(?:"""|\Z)'  # text block
+    r'|"(?:\\.|[^"\\\n])*"?'             # string literal
+    r"|'(?:\\.|[^'\\\n])*'?"             # char literal
+    r'|//[^\n]*'                         # line comment
+    r'|/\*[\s\S]*?(?:\*/|\Z)'            # block comment
+    r'|[{}]'
+)
+
+# The same tokens in a bytes or mmap source
+BRACE_TOKEN_PATTERN_BYTES = re.compile(BRACE_TOKEN_PATTERN.pattern.encode())
+
+
+class BraceIndex:
+    """Position -> brace depth lookup for Java source built in a single pass
+
+    Only the offsets of real braces (outside strings, char literals and
+    comments) are stored, together with the depth after each one, so a
+    depth query is a binary search instead of a rescan of the source.
+    Each brace also records the index of its partner, which makes finding
+    the end of a block a lookup instead of a scan.
+    """
+
+    def __init__(self, code):
+        self.positions = array('I')
+        self.depths = array('i')
+        self.partners = array('i')
+
+        if isinstance(code, str):
+            pattern, open_token, close_token = BRACE_TOKEN_PATTERN, '{', '}'
+        else:
+            pattern, open_token, close_token = BRACE_TOKEN_PATTERN_BYTES, b'{', b'}'
+
+        depth = 0
+        open_braces = []
+        for match in pattern.finditer(code):
+            token = match.group()
+            index = len(self.positions)
+            if token == open_token:
+                depth += 1
+                open_braces.append(index)
+                self.partners.append(-1)
+            elif token == close_token:
+                depth -= 1
+                if open_braces:
+                    partner = open_braces.pop()
+                    self.partners[partner] = index
+                    self.partners.append(partner)
+                else:
+                    self.partners.append(-1)
+            else:
+                continue
+            self.positions.append(match.start())
+            self.depths.append(depth)
+
+    def depth_at(self, position):
+        """Return the brace depth just before the given offset"""
+        index = bisect_left(self.positions, position)
+        return self.depths[index - 1] if index else 0
+
+    def closing_brace(self, position):
+        """Return the offset of the brace closing the '{' at position, or -1"""
+        index = bisect_left(self.positions, position)
+        if index == len(self.positions) or self.positions[index] != position:
+            return -1
+        partner = self.partners[index]
+        if partner <= index:
+            return -1
+        return self.positions[partner]
+
+    def spans_at_depth(self, depth, code_length):
+        """Yield (start, end) of every stretch of code at exactly the given depth
+
+        Each span runs from just after the brace that enters (or returns to)
+        the depth to just after the next brace, so a declaration header
+        ending in '{' is included whole. Text at depth 0 is not reported.
+        """
+        positions = self.positions
+        for index, brace_depth in enumerate(self.depths):
+            if brace_depth == depth:
+                end = positions[index + 1] + 1 if index + 1 < len(positions) else code_length
+                yield positions[index] + 1, end
+
+    def __len__(self):
+        return len(self.positions)
+
+
+# The type declared by the text before a top-level '{'
+TYPE_DECLARATION_PATTERN = re.compile(r'\b(class|interface|enum|record)\s+(\w+)[^;{}]*$')
+
+
+def iter_type_declarations(stream, chunk_size=1024 * 1024):
+    """Split Java source read from stream into top-level type declarations
+
+    Yields (kind, name, text, first_line) for each top-level brace block,
+    where text runs from the end of the previous block (so it includes the
+    package clause, imports and comments before it) to the closing brace,
+    first_line is the 1-based line text starts on and kind is None when no
+    class/interface/enum header precedes the block. Only the current
+    declaration is held in memory.
+    """
+    buffer = ""
+    position = 0
+    first_line = 1
+    depth = 0
+    header_end = None
+    eof = False
+    while True:
+        # Tokens that reach the last two characters of the buffer may go on
+        # in the next chunk (a split /*, an escape in a string), so they are
+        # only taken once more input has arrived
+        end = len(buffer) if eof else len(buffer) - 1
+        match = BRACE_TOKEN_PATTERN.search(buffer, position, max(end, position))
+        if match is None or (not eof and match.end() >= end - 1):
+            if eof:
+                break
+            if match is None:
+                # Keep one character back in case it starts a two-character token
+                position = max(position, end - 1)
+            # Read more as the declaration grows so re-joining the buffer stays linear
+            chunk = stream.read(max(chunk_size, len(buffer)))
+            if chunk:
+                buffer += chunk
+            else:
+                eof = True
+            continue
+
+        token = match.group()
+        position = match.end()
+        if token == '{':
+            if depth == 0:
+                header_end = match.start()
+            depth += 1
+        elif token == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                header = TYPE_DECLARATION_PATTERN.search(buffer, 0, header_end)
+                kind, name = header.groups() if header else (None, None)
+                yield kind, name, buffer[:position], first_line
+                first_line += buffer.count('\n', 0, position)
+                buffer = buffer[position:]
+                position = 0
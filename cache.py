@@ -0,0 +1,170 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+from fileio import atomic_write
+
+# Default number of translated units kept in memory
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def content_key(kind, options, *parts):
+    """Hash a unit kind, the translation options and the unit's source text"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(kind.encode())
+    for name, value in sorted(options.as_dict().items()):
+        digest.update(f"\0{name}={value}".encode())
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(str(part).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def types_key(types):
+    """Hash a {class name: kind} table of project types"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name, kind in sorted(types.items()):
+        digest.update(f"{name}={kind}\0".encode())
+    return digest.hexdigest()
+
+
+class UnitCache:
+    """LRU of translated units (field list, methods, main) keyed by content hash
+
+    Translating the same class again only reconverts the units whose source
+    or options changed; everything else is served from here.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached Go code for key, or None"""
+        go_code = self.entries.get(key)
+        if go_code is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return go_code
+
+    def __contains__(self, key):
+        """Whether key is cached, without counting a hit or miss or refreshing it"""
+        return key in self.entries
+
+    def put(self, key, go_code):
+        """Store go_code under key, evicting the least recently used entries"""
+        self.entries[key] = go_code
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# Modules whose code decides what the translator outputs, source maps
+# included; editing any of them changes the rule-set version and so
+# invalidates the disk cache. A module that joins the translation path
+# has to be added here.
+TRANSLATION_MODULES = ("translator.py", "rules.py", "braces.py", "importscan.py", "ir.py", "sourcemap.py")
+
+# Default size limit of the on-disk cache
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_ruleset_version = None
+
+
+def ruleset_version():
+    """Hash of the translation modules' source, computed once per process"""
+    global _ruleset_version
+    if _ruleset_version is None:
+        digest = hashlib.blake2b(digest_size=16)
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in TRANSLATION_MODULES:
+            with open(os.path.join(base_dir, name), 'rb') as file:
+                digest.update(file.read())
+        _ruleset_version = digest.hexdigest()
+    return _ruleset_version
+
+
+class DiskCache:
+    """Content-addressed store of translated files for repeated batch runs
+
+    Entries are keyed on the Java source bytes, the translation options and
+    the rule-set version, and live in a two-level directory fan-out below
+    directory. Reading an entry refreshes its mtime so evict() can drop the
+    least recently used files once the cache grows past max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, source_bytes, options, context=""):
+        """Cache key for a file; context covers anything else the output depends on"""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(ruleset_version().encode())
+        digest.update(context.encode())
+        for name, value in sorted(options.as_dict().items()):
+            digest.update(f"\0{name}={value}".encode())
+        digest.update(b"\0")
+        digest.update(source_bytes)
+        return digest.hexdigest()
+
+    def path_for(self, key, suffix=".go"):
+        return os.path.join(self.directory, key[:2], key[2:] + suffix)
+
+    def get(self, key, suffix=".go"):
+        """Return the cached Go code for key (or another entry stored under suffix), or None"""
+        path = self.path_for(key, suffix)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                go_code = file.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return go_code
+
+    def put(self, key, go_code, suffix=".go"):
+        """Store go_code under key; the rename keeps concurrent writers safe"""
+        with atomic_write(self.path_for(key, suffix)) as file:
+            file.write(go_code)
+
+    def evict(self):
+        """Delete the least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,45 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+# mkstemp creates files readable by the owner only; written files get the
+# usual umask-based mode instead. Read once, as os.umask can only be read by
+# setting it
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def find_java_files(src_dir):
+    """Return every .java file below src_dir in a stable order"""
+    java_files = []
+    for dirpath, dirnames, filenames in os.walk(src_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".java"):
+                java_files.append(os.path.join(dirpath, filename))
+    return java_files
+
+
+@contextmanager
+def atomic_write(path):
+    """Open a text file that replaces path once the with block completes
+
+    The file is written under a unique temporary name in the same
+    directory, so readers never see a partial file and concurrent writers
+    (processes or threads) never share a temporary file. If the block
+    raises, path is left untouched and the temporary file is removed.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            yield file
+        os.chmod(temp_path, 0o666 & ~UMASK)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
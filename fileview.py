@@ -0,0 +1,137 @@
+import os
+import tkinter as tk
+import tkinter.font as tkfont
+from array import array
+from tkinter import ttk
+
+# Bytes read at a time while indexing line starts
+INDEX_BLOCK_SIZE = 1024 * 1024
+
+
+def text_chunks(text, lines_per_chunk):
+    """Yield text in pieces of lines_per_chunk lines (the last may be shorter)"""
+    start = 0
+    while start < len(text):
+        end = start
+        for _ in range(lines_per_chunk):
+            end = text.find('\n', end) + 1
+            if not end:
+                end = len(text)
+                break
+        yield text[start:end]
+        start = end
+
+
+class LineIndex:
+    """Byte offsets of the line starts of a file, built in one streaming pass
+
+    Reading any range of lines is then a single seek and read, so a file of
+    any size can be shown a screenful at a time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offsets = array('Q', [0])
+        size = 0
+        with open(path, 'rb') as file:
+            while True:
+                block = file.read(INDEX_BLOCK_SIZE)
+                if not block:
+                    break
+                newline = block.find(b'\n')
+                while newline >= 0:
+                    self.offsets.append(size + newline + 1)
+                    newline = block.find(b'\n', newline + 1)
+                size += len(block)
+        self.size = size
+        # A final newline does not start another line
+        if len(self.offsets) > 1 and self.offsets[-1] == size:
+            self.offsets.pop()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def read_lines(self, first, count):
+        """Return lines first..first+count-1 as text"""
+        first = max(0, min(first, len(self.offsets) - 1))
+        last = first + count
+        end = self.offsets[last] if last < len(self.offsets) else self.size
+        with open(self.path, 'rb') as file:
+            file.seek(self.offsets[first])
+            data = file.read(end - self.offsets[first])
+        return data.decode('utf-8', errors='replace')
+
+
+class FileViewer:
+    """Read-only window that shows a large file one screenful at a time
+
+    Only the visible lines are ever in the Text widget; the scrollbar maps
+    to line numbers in the file, so opening a huge file costs one indexing
+    pass instead of loading it into Tk.
+    """
+
+    def __init__(self, parent, path):
+        self.index = LineIndex(path)
+        self.top_line = 0
+        self.visible_lines = 40
+
+        self.window = tk.Toplevel(parent)
+        self.window.title(f"{os.path.basename(path)} ({len(self.index)} lines, read-only)")
+        self.window.geometry("900x600")
+
+        frame = ttk.Frame(self.window)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(frame, wrap=tk.NONE, state="disabled")
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.line_height = tkfont.Font(font=self.text['font']).metrics('linespace')
+
+        self.status_var = tk.StringVar()
+        ttk.Label(self.window, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W).pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.text.bind("<Configure>", self.on_resize)
+        self.text.bind("<MouseWheel>", lambda event: self.scroll_to(self.top_line - event.delta // 40))
+        self.text.bind("<Button-4>", lambda event: self.scroll_to(self.top_line - 3))
+        self.text.bind("<Button-5>", lambda event: self.scroll_to(self.top_line + 3))
+        self.window.bind("<Up>", lambda event: self.scroll_to(self.top_line - 1))
+        self.window.bind("<Down>", lambda event: self.scroll_to(self.top_line + 1))
+        self.window.bind("<Prior>", lambda event: self.scroll_to(self.top_line - self.visible_lines))
+        self.window.bind("<Next>", lambda event: self.scroll_to(self.top_line + self.visible_lines))
+        self.window.bind("<Home>", lambda event: self.scroll_to(0))
+        self.window.bind("<End>", lambda event: self.scroll_to(len(self.index)))
+
+        self.render()
+
+    def on_resize(self, event):
+        visible_lines = max(1, event.height // self.line_height)
+        if visible_lines != self.visible_lines:
+            self.visible_lines = visible_lines
+            self.render()
+
+    def on_scrollbar(self, action, amount, unit=None):
+        """Handle the scrollbar's moveto/scroll commands in file lines"""
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.index)))
+        elif unit == "pages":
+            self.scroll_to(self.top_line + int(amount) * self.visible_lines)
+        else:
+            self.scroll_to(self.top_line + int(amount))
+
+    def scroll_to(self, line):
+        line = max(0, min(line, len(self.index) - self.visible_lines))
+        if line != self.top_line:
+            self.top_line = line
+            self.render()
+
+    def render(self):
+        """Show the lines that fit in the window starting at top_line"""
+        self.text.configure(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", self.index.read_lines(self.top_line, self.visible_lines))
+        self.text.configure(state="disabled")
+
+        total = len(self.index)
+        last = min(total, self.top_line + self.visible_lines)
+        self.scrollbar.set(self.top_line / total, last / total)
+        self.status_var.set(f"Lines {self.top_line + 1}-{last} of {total}")
@@ -0,0 +1,103 @@
+import argparse
+import sys
+
+# Indentation unit of the formatted output
+INDENT = '\t'
+
+
+def depth_change(stripped_line):
+    """Return (dedent_before, indent_after) for a stripped line
+
+    A line starting with '}' closes a block before it is printed and a line
+    ending with '{' opens one after it, so '} else {' stays at the level of
+    the if it continues.
+    """
+    return stripped_line.startswith('}'), stripped_line.endswith('{')
+
+
+def format_lines(lines, indent_level=0):
+    """Yield lines re-indented by brace depth, each ending in a newline
+
+    lines can be any iterable (a list, an open file), so large inputs are
+    formatted without building the whole result in memory. Uses the same
+    rules as depth_change(), inlined because this is the per-line hot loop.
+    """
+    indents = [INDENT * level for level in range(indent_level + 16)]
+    for line in lines:
+        stripped_line = line.strip()
+        if not stripped_line:
+            yield '\n'  # Preserve empty lines
+            continue
+
+        if stripped_line[0] == '}' and indent_level:
+            indent_level -= 1
+        if indent_level >= len(indents):
+            indents.append(INDENT * indent_level)
+        yield indents[indent_level] + stripped_line + '\n'
+        if stripped_line[-1] == '{':
+            indent_level += 1
+
+
+def format_go(go_code):
+    """Apply basic brace-based indentation to Go code"""
+    return "".join(format_lines(go_code.splitlines(True)))
+
+
+def enclosing_block(lines, first, last):
+    """Find the top-level brace blocks that contain lines first..last
+
+    Returns (start, end), 0-based inclusive line numbers of the region to
+    pass to format_lines(). Top-level blocks start at depth 0, so the
+    region can be reformatted without looking at the rest of the text.
+    Falls back to the whole text when first is not inside a block.
+    """
+    whole_text = 0, len(lines) - 1
+    depth = 0
+    start = None
+    for number, line in enumerate(lines):
+        stripped_line = line.strip()
+        if not stripped_line:
+            continue
+        dedent, indent = depth_change(stripped_line)
+        if dedent and depth:
+            depth -= 1
+        if depth == 0:
+            if indent:
+                if number > first and start is None:
+                    return whole_text
+                if number <= first:
+                    start = number
+            elif dedent and start is not None:
+                if number >= last:
+                    return start, number
+                if number < first:
+                    start = None
+            elif number >= first and start is None:
+                return whole_text
+        if indent:
+            depth += 1
+    return whole_text
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py format",
+        description="Re-indent Go code by brace depth"
+    )
+    parser.add_argument("files", nargs="*", help="Go files to format in place (default: stdin to stdout)")
+    return parser
+
+
+def main(argv=None):
+    """Entry point for the format command"""
+    args = build_parser().parse_args(argv)
+    if not args.files:
+        sys.stdout.writelines(format_lines(sys.stdin))
+        return 0
+
+    for path in args.files:
+        with open(path, 'r', encoding='utf-8') as file:
+            formatted_code = "".join(format_lines(file))
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(formatted_code)
+    return 0
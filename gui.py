@@ -0,0 +1,711 @@
+import tkinter as tk
+from tkinter import scrolledtext, messagebox, filedialog, ttk
+import multiprocessing
+import os
+import time
+
+from cache import UnitCache
+from fileview import FileViewer, text_chunks
+from formatter import enclosing_block, format_lines
+from highlight import Highlighter, add_yscroll_callback
+from project import DEFAULT_INDEX_NAME, SymbolIndex
+from textdiff import changed_hunks, merge_hunks, split_lines
+from translator import JavaToGoEngine, TranslationOptions, TranslationTimeout, time_limit
+
+# Longest a single translation may run before it is abandoned (seconds)
+TRANSLATION_TIMEOUT = 30
+
+# How often the UI checks on a background translation (milliseconds)
+POLL_INTERVAL_MS = 50
+
+# Minimum time between progress messages from the worker (seconds)
+PROGRESS_INTERVAL = 0.1
+
+# Pause in typing before a live translation starts (milliseconds)
+LIVE_TRANSLATE_DELAY_MS = 300
+
+# Texts with more lines than this are loaded in chunks and shown without word wrap
+LARGE_TEXT_LINES = 5000
+
+# Lines inserted into a text widget per idle callback when loading a large text
+LOAD_CHUNK_LINES = 2000
+
+# Files bigger than this are offered in the read-only windowed viewer (bytes)
+VIEWER_FILE_BYTES = 20 * 1024 * 1024
+
+
+def translation_worker(connection):
+    """Serve translation requests from the GUI in a worker process
+
+    The worker lives as long as the window (unless a job is cancelled), so
+    its unit cache lets re-translations only reconvert the methods that
+    changed since the last run.
+    """
+    cache = UnitCache()
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        java_code, options, timeout, types = request
+        last_report = [0.0]
+        
+        def progress(phase, done, total):
+            now = time.monotonic()
+            if now - last_report[0] >= PROGRESS_INTERVAL:
+                last_report[0] = now
+                connection.send(("progress", (phase, done, total)))
+        
+        try:
+            engine = JavaToGoEngine(options, progress=progress, cache=cache, types=types)
+            hits = cache.hits
+            with time_limit(timeout):
+                go_code = engine.translate(java_code)
+            connection.send(("done", (go_code, engine.passes, cache.hits - hits, engine.timer.summary(), engine.source_map)))
+        except TranslationTimeout:
+            connection.send(("timeout", None))
+        except Exception as e:
+            connection.send(("error", str(e)))
+
+
+class JavaToGoTranslator:
+    def __init__(self):
+        # Initialize the main window
+        self.root = tk.Tk()
+        self.root.title("Java to Golang Translator")
+        self.root.geometry("1000x700")
+        
+        # Set up the main frame
+        self.main_frame = ttk.Frame(self.root, padding="10")
+        self.main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Create the menu bar
+        self.create_menu()
+        
+        # Create UI elements
+        self.create_ui()
+        
+        # Add example templates
+        self.setup_example_templates()
+        
+        # (process, pipe) of the background translation worker, if started
+        self.worker = None
+        self.translating = False
+        self.live_job = False
+        self.live_after_id = None
+        # text widget -> (after id, remaining chunks) of chunked loads in progress
+        self.loads = {}
+        # {class name: kind} of the open project folder, used to resolve types
+        self.project_types = {}
+        # Java lines behind each line of the Go pane, from the last translation
+        self.source_map = None
+        # Go code last written by a translation; what differs from it in the pane are hand edits
+        self.go_output = None
+        # Pane under the mouse; only its scrolling moves the other pane
+        self.scroll_leader = None
+        
+    def create_menu(self):
+        menubar = tk.Menu(self.root)
+        
+        # File menu
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Open Java File", command=self.open_file)
+        file_menu.add_command(label="Save Go File", command=self.save_file)
+        file_menu.add_command(label="View Large File...", command=self.view_large_file)
+        file_menu.add_command(label="Open Project Folder...", command=self.open_project)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.root.quit)
+        menubar.add_cascade(label="File", menu=file_menu)
+        
+        # Help menu
+        help_menu = tk.Menu(menubar, tearoff=0)
+        help_menu.add_command(label="About", command=self.show_about)
+        help_menu.add_command(label="How to Use", command=self.show_help)
+        menubar.add_cascade(label="Help", menu=help_menu)
+        
+        self.root.config(menu=menubar)
+    
+    def create_ui(self):
+        # Create top frame for input
+        top_frame = ttk.LabelFrame(self.main_frame, text="Java Code Input", padding="10")
+        top_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Template selection frame
+        template_frame = ttk.Frame(top_frame)
+        template_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(template_frame, text="Templates:").pack(side=tk.LEFT, padx=5)
+        self.template_var = tk.StringVar()
+        self.template_combo = ttk.Combobox(template_frame, textvariable=self.template_var, state="readonly", width=30)
+        self.template_combo['values'] = ("Empty", "Hello World", "Simple Class", "For Loop Example", "Method Example")
+        self.template_combo.current(0)
+        self.template_combo.pack(side=tk.LEFT, padx=5)
+        load_template_btn = ttk.Button(template_frame, text="Load Template", command=self.load_template)
+        load_template_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Options frame
+        options_frame = ttk.Frame(top_frame)
+        options_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # Add translation options
+        self.keep_comments_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Keep comments", variable=self.keep_comments_var).pack(side=tk.LEFT, padx=5)
+        
+        self.use_pointers_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Use pointers for structs", variable=self.use_pointers_var).pack(side=tk.LEFT, padx=5)
+        
+        self.capitalize_fields_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Capitalize exported fields", variable=self.capitalize_fields_var).pack(side=tk.LEFT, padx=5)
+        
+        self.live_translate_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="Live translate", variable=self.live_translate_var).pack(side=tk.LEFT, padx=5)
+        
+        self.sync_scroll_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Sync scrolling", variable=self.sync_scroll_var).pack(side=tk.LEFT, padx=5)
+        
+        # Java input text area
+        self.java_text = scrolledtext.ScrolledText(top_frame, wrap=tk.WORD, width=80, height=15)
+        self.java_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.java_text.bind("<<Modified>>", self.on_java_modified)
+        self.java_highlighter = Highlighter(self.java_text, "java")
+        
+        # Middle frame for buttons
+        middle_frame = ttk.Frame(self.main_frame, padding="10")
+        middle_frame.pack(fill=tk.X)
+        
+        # Translate button
+        translate_button = ttk.Button(middle_frame, text="Translate to Go", command=self.translate_code)
+        translate_button.pack(side=tk.LEFT, padx=5)
+        
+        # Cancel button, only enabled while a translation is running
+        self.cancel_button = ttk.Button(middle_frame, text="Cancel", command=self.cancel_translation, state="disabled")
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        
+        # Clear button
+        clear_button = ttk.Button(middle_frame, text="Clear Both", command=self.clear_text)
+        clear_button.pack(side=tk.LEFT, padx=5)
+        
+        # Copy button for Go code
+        copy_button = ttk.Button(middle_frame, text="Copy Go Code", command=self.copy_go_code)
+        copy_button.pack(side=tk.LEFT, padx=5)
+        
+        # Format button for Go code
+        format_button = ttk.Button(middle_frame, text="Format Go Code", command=self.format_go_code)
+        format_button.pack(side=tk.LEFT, padx=5)
+        
+        # Bottom frame for output
+        bottom_frame = ttk.LabelFrame(self.main_frame, text="Generated Go Code", padding="10")
+        bottom_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Go output text area
+        self.go_text = scrolledtext.ScrolledText(bottom_frame, wrap=tk.WORD, width=80, height=15)
+        self.go_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.go_highlighter = Highlighter(self.go_text, "go")
+        
+        # Scrolling and clicking in one pane follows the source map into the other
+        for widget in (self.java_text, self.go_text):
+            widget.tag_configure("source_link", background="#d6e9ff")
+            widget.bind("<Enter>", lambda event: setattr(self, "scroll_leader", event.widget))
+            widget.bind("<ButtonRelease-1>", self.jump_to_source, add="+")
+            add_yscroll_callback(widget, lambda widget=widget: self.sync_scroll(widget))
+        
+        # Status bar
+        self.status_var = tk.StringVar()
+        self.status_var.set("Ready")
+        self.status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    
+    def options_from_widgets(self):
+        """Read the translation options from the option checkboxes"""
+        return TranslationOptions(
+            keep_comments=self.keep_comments_var.get(),
+            use_pointers=self.use_pointers_var.get(),
+            capitalize_fields=self.capitalize_fields_var.get()
+        )
+    
+    def format_go_code(self):
+        """Re-indent the top-level block around the selection or cursor
+
+        Only the lines of that region are touched, and only when they
+        changed, so large outputs keep their scroll position and format
+        instantly. Without a surrounding block the whole text is formatted.
+        """
+        self.finish_loading(self.go_text)
+        go_code = self.go_text.get("1.0", "end-1c")
+        if not go_code.strip():
+            messagebox.showinfo("Info", "No Go code to format!")
+            return
+            
+        try:
+            if self.go_text.tag_ranges(tk.SEL):
+                first = int(self.go_text.index(tk.SEL_FIRST).split('.')[0]) - 1
+                last = int(self.go_text.index(tk.SEL_LAST).split('.')[0]) - 1
+            else:
+                first = last = int(self.go_text.index(tk.INSERT).split('.')[0]) - 1
+            
+            lines = go_code.split('\n')
+            start, end = enclosing_block(lines, first, last)
+            region = "".join(format_lines(lines[start:end + 1]))[:-1]
+            
+            # Update only the lines of the region whose indentation changed
+            if region != "\n".join(lines[start:end + 1]):
+                lines[start:end + 1] = region.split('\n')
+                self.update_text(self.go_text, "\n".join(lines))
+            self.status_var.set(f"Go code formatted (lines {start + 1}-{end + 1})")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error formatting Go code: {str(e)}")
+            self.status_var.set("Format error")
+    
+    def copy_go_code(self):
+        """Copy the generated Go code to clipboard"""
+        self.finish_loading(self.go_text)
+        go_code = self.go_text.get("1.0", tk.END).strip()
+        if go_code:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(go_code)
+            self.status_var.set("Go code copied to clipboard")
+        else:
+            messagebox.showinfo("Info", "No Go code to copy!")
+            
+    def setup_example_templates(self):
+        """Create example Java code templates"""
+        self.templates = {
+            "Empty": "",
+            "Hello World": """public class HelloWorld {
+    public static void main(String[] args) {
+        System.out.println("Hello, Go world!");
+    }
+}""",
+            "Simple Class": """public class Person {
+    private String name;
+    private int age;
+    
+    public Person(String name, int age) {
+        this.name = name;
+        this.age = age;
+    }
+    
+    public String getName() {
+        return name;
+    }
+    
+    public int getAge() {
+        return age;
+    }
+    
+    public void greet() {
+        System.out.println("Hello, my name is " + name);
+    }
+}""",
+            "For Loop Example": """public class LoopExample {
+    public static void main(String[] args) {
+        // Simple for loop
+        for (int i = 0; i < 10; i++) {
+            System.out.println("Count: " + i);
+        }
+        
+        // While loop
+        int j = 0;
+        while (j < 5) {
+            System.out.println("While: " + j);
+            j++;
+        }
+    }
+}""",
+            "Method Example": """public class Calculator {
+    public int add(int a, int b) {
+        return a + b;
+    }
+    
+    public int subtract(int a, int b) {
+        return a - b;
+    }
+    
+    public double divide(int a, int b) {
+        if (b == 0) {
+            throw new ArithmeticException("Cannot divide by zero");
+        }
+        return (double) a / b;
+    }
+    
+    public static void main(String[] args) {
+        Calculator calc = new Calculator();
+        System.out.println("5 + 3 = " + calc.add(5, 3));
+        System.out.println("10 - 4 = " + calc.subtract(10, 4));
+        System.out.println("15 / 2 = " + calc.divide(15, 2));
+    }
+}"""
+        }
+    
+    def load_template(self):
+        """Load selected template into the Java text area"""
+        template_name = self.template_var.get()
+        if template_name in self.templates:
+            # Replace the existing text with the template
+            self.load_text(self.java_text, self.templates[template_name])
+            self.status_var.set(f"Loaded {template_name} template")
+    
+    def translate_code(self, live=False):
+        self.finish_loading(self.java_text)
+        java_code = self.java_text.get("1.0", tk.END)
+        if not java_code.strip():
+            if not live:
+                messagebox.showwarning("Warning", "Please enter Java code first!")
+            return
+        
+        if self.translating:
+            if live:
+                # Let the running job finish and try again afterwards
+                self.schedule_live_translation()
+                return
+            # A new request replaces a running one
+            self.cancel_translation(quiet=True)
+        
+        # Translate in a separate process so the window stays responsive and
+        # a running job can be stopped
+        if self.worker is None:
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=translation_worker, args=(worker_connection,), daemon=True)
+            process.start()
+            worker_connection.close()
+            self.worker = (process, connection)
+        
+        _, connection = self.worker
+        connection.send((java_code, self.options_from_widgets(), TRANSLATION_TIMEOUT, self.project_types))
+        self.translating = True
+        self.live_job = live
+        self.cancel_button.state(["!disabled"])
+        self.status_var.set("Translating...")
+        self.root.after(POLL_INTERVAL_MS, self.poll_translation)
+    
+    def poll_translation(self):
+        """Pick up progress and results from the translation worker"""
+        if not self.translating:
+            return
+        _, connection = self.worker
+        
+        try:
+            while connection.poll():
+                kind, payload = connection.recv()
+                if kind == "progress":
+                    phase, done, total = payload
+                    if total:
+                        self.status_var.set(f"Translating... {phase} {done}/{total}")
+                    else:
+                        self.status_var.set(f"Translating... {phase}")
+                    continue
+                
+                self.finish_translation()
+                if kind == "done":
+                    go_code, passes, cached_units, phases, self.source_map = payload
+                    kept = self.update_text(self.go_text, go_code, self.go_output)
+                    self.go_output = go_code
+                    status = f"Translation complete ({passes} rewrite passes, {cached_units} cached units)"
+                    if kept:
+                        status += f", {kept} hand-edited regions kept"
+                    if phases:
+                        status += f" - {phases}"
+                    self.status_var.set(status)
+                elif kind == "timeout":
+                    self.status_var.set("Translation timed out")
+                    if not self.live_job:
+                        messagebox.showerror("Error", f"Translation took longer than {TRANSLATION_TIMEOUT} seconds and was stopped.")
+                else:
+                    self.status_var.set("Translation error")
+                    if not self.live_job:
+                        messagebox.showerror("Error", f"An error occurred during translation: {payload}")
+                return
+        except EOFError:
+            # The worker went away without sending a result
+            self.stop_worker()
+            self.finish_translation()
+            self.status_var.set("Translation error")
+            return
+        
+        self.root.after(POLL_INTERVAL_MS, self.poll_translation)
+    
+    def cancel_translation(self, quiet=False):
+        """Stop the running translation, if there is one"""
+        if not self.translating:
+            return
+        # The worker is busy inside the engine, so it has to be killed; a
+        # fresh one (with an empty cache) is started for the next request
+        self.stop_worker()
+        self.finish_translation()
+        if not quiet:
+            self.status_var.set("Translation cancelled")
+    
+    def finish_translation(self):
+        """Mark the current translation as over and reset the Cancel button"""
+        self.translating = False
+        self.cancel_button.state(["disabled"])
+    
+    def stop_worker(self):
+        """Terminate the translation worker process"""
+        if self.worker is None:
+            return
+        process, connection = self.worker
+        self.worker = None
+        process.terminate()
+        connection.close()
+        process.join(timeout=1)
+    
+    def on_java_modified(self, event=None):
+        """Schedule a live translation when the Java input changes"""
+        # Reset the flag so Tk reports the next modification too
+        self.java_text.edit_modified(False)
+        # A chunked load schedules one live translation when it is done
+        if self.java_text in self.loads:
+            return
+        if self.live_translate_var.get():
+            self.schedule_live_translation()
+    
+    def schedule_live_translation(self):
+        """Translate once typing has paused for LIVE_TRANSLATE_DELAY_MS"""
+        if self.live_after_id is not None:
+            self.root.after_cancel(self.live_after_id)
+        self.live_after_id = self.root.after(LIVE_TRANSLATE_DELAY_MS, self.run_live_translation)
+    
+    def run_live_translation(self):
+        self.live_after_id = None
+        if self.live_translate_var.get():
+            self.translate_code(live=True)
+    
+    def open_file(self):
+        """Open a Java file for translation"""
+        file_path = filedialog.askopenfilename(
+            title="Open Java File",
+            filetypes=[("Java Files", "*.java"), ("All Files", "*.*")]
+        )
+        
+        if file_path:
+            try:
+                if os.path.getsize(file_path) > VIEWER_FILE_BYTES and messagebox.askyesno(
+                    "Large File",
+                    "This file is very large. Open it in the read-only viewer instead of the editor?"
+                ):
+                    FileViewer(self.root, file_path)
+                    self.status_var.set(f"Viewing: {os.path.basename(file_path)}")
+                    return
+                with open(file_path, 'r') as file:
+                    java_code = file.read()
+                self.load_text(self.java_text, java_code)
+                self.status_var.set(f"Opened: {os.path.basename(file_path)}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Error opening file: {str(e)}")
+                self.status_var.set("Error opening file")
+    
+    def save_file(self):
+        """Save the generated Go code to a file"""
+        self.finish_loading(self.go_text)
+        go_code = self.go_text.get("1.0", tk.END).strip()
+        if not go_code:
+            messagebox.showwarning("Warning", "No Go code to save!")
+            return
+            
+        file_path = filedialog.asksaveasfilename(
+            title="Save Go File",
+            defaultextension=".go",
+            filetypes=[("Go Files", "*.go"), ("All Files", "*.*")]
+        )
+        
+        if file_path:
+            try:
+                with open(file_path, 'w') as file:
+                    file.write(go_code)
+                self.status_var.set(f"Saved: {os.path.basename(file_path)}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Error saving file: {str(e)}")
+                self.status_var.set("Error saving file")
+    
+    def open_project(self):
+        """Index the classes of a source tree so translations can resolve its types"""
+        folder = filedialog.askdirectory(title="Open Project Folder")
+        if not folder:
+            return
+        try:
+            self.status_var.set("Indexing project...")
+            self.root.update_idletasks()
+            index_path = os.path.join(folder, DEFAULT_INDEX_NAME)
+            index = SymbolIndex.load(index_path)
+            counts = index.update(folder)
+            index.save(index_path)
+            self.project_types = index.type_kinds()
+            self.status_var.set(f"Project {os.path.basename(folder)}: {len(index)} types "
+                                f"({counts['indexed']} files parsed, {counts['unchanged']} unchanged)")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error indexing project: {str(e)}")
+            self.status_var.set("Error indexing project")
+    
+    def view_large_file(self):
+        """Show a file in the read-only windowed viewer without loading it"""
+        file_path = filedialog.askopenfilename(
+            title="View Large File",
+            filetypes=[("Java Files", "*.java"), ("Go Files", "*.go"), ("All Files", "*.*")]
+        )
+        if file_path:
+            try:
+                FileViewer(self.root, file_path)
+                self.status_var.set(f"Viewing: {os.path.basename(file_path)}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Error opening file: {str(e)}")
+                self.status_var.set("Error opening file")
+    
+    def sync_scroll(self, widget):
+        """Scroll the other pane to the lines matching the top of widget"""
+        if self.source_map is None or widget is not self.scroll_leader or not self.sync_scroll_var.get():
+            return
+        top = int(widget.index("@0,0").split('.')[0])
+        if widget is self.go_text:
+            java_range = self.source_map.java_range(top)
+            if java_range:
+                self.java_text.yview(f"{java_range[0]}.0")
+        else:
+            go_line = self.source_map.go_line(top)
+            if go_line:
+                self.go_text.yview(f"{go_line}.0")
+    
+    def jump_to_source(self, event):
+        """Mark and show the lines in the other pane that match the clicked line"""
+        if self.source_map is None:
+            return
+        line = int(event.widget.index(tk.INSERT).split('.')[0])
+        if event.widget is self.go_text:
+            target, lines = self.java_text, self.source_map.java_range(line)
+        else:
+            go_line = self.source_map.go_line(line)
+            target, lines = self.go_text, (go_line, go_line) if go_line else None
+        target.tag_remove("source_link", "1.0", tk.END)
+        if lines:
+            first, last = lines
+            target.tag_add("source_link", f"{first}.0", f"{last}.end")
+            target.see(f"{first}.0")
+    
+    def update_text(self, widget, text, base=None):
+        """Bring a text widget to text by replacing only the lines that differ
+
+        Unchanged lines are not touched, so Tk only lays out the changed
+        hunks and the scroll position and cursor stay where they were.
+        With base (the text last written to the widget), hand edits in
+        regions that text does not change are kept. Returns the number of
+        edited regions kept; an empty widget or a change of more than
+        LARGE_TEXT_LINES lines is loaded with load_text() instead.
+        """
+        if widget in self.loads or widget.compare("end-1c", "==", "1.0"):
+            self.load_text(widget, text)
+            return 0
+        current_lines = split_lines(widget.get("1.0", "end-1c"))
+        new_lines = split_lines(text)
+        if base is None:
+            hunks, kept = changed_hunks(current_lines, new_lines), 0
+        else:
+            hunks, kept = merge_hunks(split_lines(base), current_lines, new_lines)
+        if sum(new_end - new_start for _, _, new_start, new_end in hunks) >= LARGE_TEXT_LINES:
+            self.load_text(widget, text)
+            return 0
+        
+        insert = widget.index(tk.INSERT)
+        top = widget.index("@0,0")
+        # Hunks come last first, so earlier line numbers stay valid
+        for start, end, new_start, new_end in hunks:
+            widget.replace(f"{start + 1}.0", f"{end + 1}.0", "".join(new_lines[new_start:new_end]))
+        widget.mark_set(tk.INSERT, insert)
+        widget.yview(top)
+        return kept
+    
+    def load_text(self, widget, text):
+        """Replace the contents of a text widget, in chunks if the text is large
+
+        Large texts are inserted LOAD_CHUNK_LINES at a time from after()
+        callbacks so the window keeps responding, and word wrap is turned
+        off for them because wrapping long texts is what makes Tk slow.
+        """
+        self.cancel_loading(widget)
+        if widget is self.java_text:
+            # New Java code no longer matches the last translation's line map
+            self.source_map = None
+        widget.delete("1.0", tk.END)
+        if text.count('\n') < LARGE_TEXT_LINES:
+            widget.configure(wrap=tk.WORD)
+            widget.insert("1.0", text)
+            return
+        
+        widget.configure(wrap=tk.NONE)
+        self.loads[widget] = (None, text_chunks(text, LOAD_CHUNK_LINES))
+        self.load_next_chunk(widget)
+    
+    def load_next_chunk(self, widget):
+        _, chunks = self.loads[widget]
+        chunk = next(chunks, None)
+        if chunk is None:
+            del self.loads[widget]
+            self.status_var.set(f"Loaded {int(widget.index('end-1c').split('.')[0])} lines")
+            if widget is self.java_text and self.live_translate_var.get():
+                self.schedule_live_translation()
+            return
+        widget.insert("end-1c", chunk)
+        self.status_var.set(f"Loading... {int(widget.index('end-1c').split('.')[0])} lines")
+        self.loads[widget] = (self.root.after(1, self.load_next_chunk, widget), chunks)
+    
+    def finish_loading(self, widget):
+        """Insert whatever is left of a chunked load right away"""
+        if widget not in self.loads:
+            return
+        after_id, chunks = self.loads.pop(widget)
+        self.root.after_cancel(after_id)
+        widget.insert("end-1c", "".join(chunks))
+    
+    def cancel_loading(self, widget):
+        """Drop the rest of a chunked load"""
+        if widget in self.loads:
+            after_id, _ = self.loads.pop(widget)
+            self.root.after_cancel(after_id)
+    
+    def clear_text(self):
+        """Clear both input and output text areas"""
+        self.cancel_loading(self.java_text)
+        self.cancel_loading(self.go_text)
+        self.java_text.delete("1.0", tk.END)
+        self.go_text.delete("1.0", tk.END)
+        self.source_map = None
+        self.go_output = None
+        self.status_var.set("Ready")
+    
+    def show_about(self):
+        """Show information about the application"""
+        messagebox.showinfo(
+            "About",
+            "Java to Go Translator\n\n"
+            "This application helps to translate Java code to Go.\n"
+            "It is intended as a starting point for migration projects and\n"
+            "may require additional manual adjustments to the code."
+        )
+    
+    def show_help(self):
+        """Show help information"""
+        messagebox.showinfo(
+            "How to Use",
+            "1. Enter Java code in the top text area or load a template.\n"
+            "2. Click 'Translate to Go' to generate Go code. Large files are\n"
+            "   translated in the background; click 'Cancel' to stop.\n"
+            "   With 'Live translate' checked the Go code updates as you type.\n"
+            "3. The generated Go code will appear in the bottom text area.\n"
+            "4. 'Format Go Code' re-indents the function around the cursor\n"
+            "   (or the selection).\n"
+            "5. You can save the code to a file or copy it to clipboard.\n"
+            "6. Very large files load in steps without word wrap; use\n"
+            "   File > View Large File to page through a file read-only.\n"
+            "7. Go lines highlighted in yellow need a manual look.\n"
+            "8. Click a line in either pane to show the matching lines in\n"
+            "   the other; with 'Sync scrolling' the panes scroll together.\n\n"
+            "Note: The translator handles basic Java constructs but may not\n"
+            "accurately translate all complex Java idioms. Always review\n"
+            "and test the generated Go code."
+        )
+    
+    def run(self):
+        """Start the application"""
+        self.root.mainloop()
@@ -0,0 +1,229 @@
+import re
+from array import array
+
+# State at the start of a line: plain code, inside /* */, inside a multi-line string
+CODE, BLOCK_COMMENT, RAW_STRING = 0, 1, 2
+
+# Extra lines above and below the visible region that are tagged as well
+VIEW_MARGIN_LINES = 10
+
+# Tag name -> text widget options
+TAG_STYLES = {
+    "keyword": dict(foreground="#0033b3"),
+    "string": dict(foreground="#067d17"),
+    "comment": dict(foreground="#8c8c8c"),
+    "number": dict(foreground="#1750eb"),
+    "attention": dict(background="#fff3b0"),
+}
+
+JAVA_KEYWORDS = (
+    "abstract boolean break byte case catch char class continue default do double else enum extends "
+    "final finally float for if implements import instanceof int interface long new null package "
+    "private protected public return short static super switch this throw throws try void while "
+    "true false var record"
+)
+
+GO_KEYWORDS = (
+    "break case chan const continue default defer else fallthrough for func go goto if import "
+    "interface map package range return select struct switch type var nil true false "
+    "int int64 int16 float32 float64 string bool rune byte error"
+)
+
+# Go code the translator could not convert cleanly and that needs a manual look
+GO_ATTENTION = r'//\s*Error handling.*|fmt\.Errorf|if err != nil|\b(?:throw|new|try|catch|public|private|protected)\b|\bthis\.'
+
+
+class Language:
+    """Token patterns for one pane's language"""
+
+    def __init__(self, keywords, raw_delimiter, attention=None):
+        self.raw_delimiter = raw_delimiter
+        raw = re.escape(raw_delimiter)
+        self.token_pattern = re.compile(
+            r'(?P<comment>//.*|/\*.*?\*/)'
+            r'|(?P<open_comment>/\*.*)'
+            rf'|(?P<raw>{raw}.*?{raw})'
+            rf'|(?P<open_raw>{raw}.*)'
+            r'|(?P<string>"(?:\\.|[^"\\])*"?|\'(?:\\.|[^\'\\])*\'?)'
+            r'|(?P<keyword>\b(?:' + "|".join(keywords.split()) + r')\b)'
+            r'|(?P<number>\b\d+(?:\.\d+)?\b)'
+        )
+        self.attention_pattern = re.compile(attention) if attention else None
+
+
+LANGUAGES = {
+    "java": Language(JAVA_KEYWORDS, '"""'),
+    "go": Language(GO_KEYWORDS, '`', GO_ATTENTION),
+}
+
+
+def scan_line(line, state, language):
+    """Tokenize one line starting in state; returns ([(start, end, tag)], end state)"""
+    spans = []
+    position = 0
+    if state != CODE:
+        closer = "*/" if state == BLOCK_COMMENT else language.raw_delimiter
+        tag = "comment" if state == BLOCK_COMMENT else "string"
+        end = line.find(closer)
+        if end < 0:
+            return [(0, len(line), tag)], state
+        position = end + len(closer)
+        spans.append((0, position, tag))
+
+    state = CODE
+    for match in language.token_pattern.finditer(line, position):
+        kind = match.lastgroup
+        if kind == "open_comment":
+            spans.append((match.start(), match.end(), "comment"))
+            state = BLOCK_COMMENT
+        elif kind == "open_raw":
+            spans.append((match.start(), match.end(), "string"))
+            state = RAW_STRING
+        else:
+            spans.append((match.start(), match.end(), "string" if kind == "raw" else kind))
+
+    if language.attention_pattern is not None:
+        for match in language.attention_pattern.finditer(line):
+            spans.append((match.start(), match.end(), "attention"))
+    return spans, state
+
+
+class Highlighter:
+    """Incremental syntax highlighting for a Tk text widget
+
+    The state at the start of every line (inside a block comment or a
+    multi-line string, or not) is cached, together with whether the line's
+    tags are current. An edit only invalidates the lines it touched and
+    the states after them; tags are then recomputed for the visible lines
+    alone, so typing in a long file costs a screenful of work.
+    """
+
+    def __init__(self, widget, language):
+        self.widget = widget
+        self.language = LANGUAGES[language]
+        self.after_id = None
+
+        line_count = int(widget.index("end-1c").split('.')[0])
+        # states[i]: state at the start of line i + 1; only the first known entries are trusted
+        self.states = array('b', bytes(line_count))
+        self.known = 1
+        # tagged[i]: the tags of line i + 1 match its text and start state
+        self.tagged = bytearray(line_count)
+
+        for tag, style in TAG_STYLES.items():
+            widget.tag_configure(tag, **style)
+        widget.tag_raise("attention")
+
+        self.original = intercept_edits(widget, self.on_edit)
+        add_yscroll_callback(widget, self.schedule_refresh)
+        self.schedule_refresh()
+
+    def on_edit(self, first, old_last, new_last):
+        """Splice the line tables after lines first..old_last became first..new_last (0-based)"""
+        self.states[first + 1:old_last + 1] = array('b', bytes(new_last - first))
+        self.tagged[first:old_last + 1] = bytes(new_last - first + 1)
+        self.known = min(self.known, first + 1)
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        if self.after_id is None:
+            self.after_id = self.widget.after_idle(self.refresh)
+
+    def refresh(self):
+        """Tag the stale lines in and around the visible region"""
+        self.after_id = None
+        first = int(self.widget.index("@0,0").split('.')[0]) - 1
+        last = int(self.widget.index(f"@0,{self.widget.winfo_height()}").split('.')[0]) - 1
+        first = max(0, first - VIEW_MARGIN_LINES)
+        last = min(len(self.states) - 1, last + VIEW_MARGIN_LINES)
+        self.extend_states(last)
+
+        stale = [number for number in range(first, last + 1) if not self.tagged[number]]
+        if not stale:
+            return
+        lines = self.widget.get(f"{stale[0] + 1}.0", f"{stale[-1] + 1}.end").split('\n')
+        for number in stale:
+            line = lines[number - stale[0]]
+            for tag in TAG_STYLES:
+                self.widget.tag_remove(tag, f"{number + 1}.0", f"{number + 1}.end")
+            spans, _ = scan_line(line, self.states[number], self.language)
+            for start, end, tag in spans:
+                self.widget.tag_add(tag, f"{number + 1}.{start}", f"{number + 1}.{end}")
+            self.tagged[number] = 1
+
+    def extend_states(self, last):
+        """Make the start states of lines up to last (0-based) trustworthy"""
+        if self.known > last:
+            return
+        lines = self.widget.get(f"{self.known}.0", f"{last}.end").split('\n')
+        state = self.states[self.known - 1]
+        for offset, line in enumerate(lines):
+            _, state = scan_line(line, state, self.language)
+            number = self.known + offset
+            if self.states[number] != state:
+                # The line now starts in a different state, so its old tags are wrong
+                self.states[number] = state
+                self.tagged[number] = 0
+        self.known = last + 1
+
+
+# Body of the Tcl procedure that stands in for an intercepted text widget.
+# ORIGINAL is the renamed widget command and NOTIFY the Python callback.
+# Indexes past the last character are clamped to end-1c, since Tk inserts
+# and deletes there rather than on the line after the final newline.
+EDIT_PROC_BODY = """
+    if {$operation ni {insert delete replace} || ![llength $args]} {
+        return [ORIGINAL $operation {*}$args]
+    }
+    set first [ORIGINAL index [lindex $args 0]]
+    if {$operation eq "insert"} {
+        set last $first
+    } elseif {[llength $args] > 1} {
+        set last [ORIGINAL index [lindex $args 1]]
+    } else {
+        set last [ORIGINAL index "$first +1c"]
+    }
+    if {[ORIGINAL compare $first > end-1c]} {set first [ORIGINAL index end-1c]}
+    if {[ORIGINAL compare $last > end-1c]} {set last [ORIGINAL index end-1c]}
+    set old_end [ORIGINAL index end-1c]
+    set result [ORIGINAL $operation {*}$args]
+    NOTIFY $first $last $old_end [ORIGINAL index end-1c]
+    return $result
+"""
+
+
+def intercept_edits(widget, callback):
+    """Route a text widget's insert/delete/replace through callback(first, old_last, new_last)
+
+    The widget's Tcl command is renamed, as IDLE's WidgetRedirector does,
+    and replaced by a Tcl procedure rather than a Python function. Errors
+    of the real command (a bad index, deleting an empty selection) then
+    reach the caller as the usual Tcl errors, which Tk's own bindings
+    catch; an error raised from a Python command would lose its message
+    and be raised again from mainloop. Only the notification runs in
+    Python, after the edit succeeded. Line numbers passed to callback are
+    0-based. Returns the name of the original command.
+    """
+    original = widget._w + "_original"
+    widget.tk.call("rename", widget._w, original)
+
+    def notify(first, last, old_end, new_end):
+        first, last, old_end, new_end = (int(index.split('.')[0]) - 1 for index in (first, last, old_end, new_end))
+        old_last = max(first, last)
+        callback(first, old_last, max(first, old_last + new_end - old_end))
+
+    body = EDIT_PROC_BODY.replace("ORIGINAL", original).replace("NOTIFY", widget.register(notify))
+    widget.tk.call("proc", widget._w, "operation args", body)
+    return original
+
+
+def add_yscroll_callback(widget, callback):
+    """Call callback() whenever the widget's view moves, after its existing yscrollcommand"""
+    previous = widget.tk.splitlist(str(widget["yscrollcommand"]))
+
+    def on_scroll(*args):
+        if previous:
+            widget.tk.call(*previous, *args)
+        callback()
+
+    widget.configure(yscrollcommand=on_scroll)
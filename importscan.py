@@ -0,0 +1,69 @@
+import re
+
+# Qualified identifiers in emitted Go code -> the package they need imported
+GO_IMPORT_TRIGGERS = {
+    "fmt.": "fmt",
+    "strings.": "strings",
+    "strconv.": "strconv",
+    "errors.": "errors",
+    "time.": "time",
+    "math.": "math",
+    "os.": "os",
+    "bufio.": "bufio",
+    "unicode.": "unicode",
+}
+
+# Go tokens whose text must not count as a use: string, raw string and rune literals, comments
+SKIPPED_TOKENS = (
+    r'"(?:\\.|[^"\\\n])*"'
+    r'|`[^`]*`'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r'|//[^\n]*'
+    r'|/\*[\s\S]*?(?:\*/|\Z)'
+)
+
+
+def trie_pattern(words):
+    """Regex matching any of words, with shared prefixes merged into one branch
+
+    The regex engine then follows a single path per starting position, so
+    matching cost depends on the length of the words, not their number.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if "" in node:
+            branches.append("")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class ImportDetector:
+    """Finds the packages Go code uses in one scan over the code
+
+    All trigger tokens go into a single prefix-trie alternation, next to
+    patterns for literals and comments that are matched only to be
+    skipped, so a package is imported exactly when a qualified identifier
+    of it appears in the code itself.
+    """
+
+    def __init__(self, triggers=GO_IMPORT_TRIGGERS):
+        self.triggers = dict(triggers)
+        self.pattern = re.compile(SKIPPED_TOKENS + r'|(?<![\w.])(' + trie_pattern(self.triggers) + ')')
+
+    def packages(self, go_code):
+        """Return the set of packages used in go_code"""
+        # findall keeps the scan in C; skipped tokens come back as ''
+        return {self.triggers[token] for token in set(self.pattern.findall(go_code)) if token}
+
+
+GO_IMPORTS = ImportDetector()
@@ -0,0 +1,76 @@
+def decode_source(value):
+    """Turn a slice of a str, bytes or mmap source into str"""
+    if isinstance(value, str):
+        return value
+    return value.decode('utf-8', errors='replace')
+
+
+class FieldDecl:
+    """A field of a class and the Java line of its name"""
+
+    __slots__ = ("field_type", "name", "default", "line")
+
+    def __init__(self, field_type, name, default, line):
+        self.field_type = field_type
+        self.name = name
+        self.default = default
+        self.line = line
+
+    def key(self):
+        """The parts of the field that its translation depends on"""
+        return self.field_type, self.name, self.default
+
+
+class MethodDecl:
+    """A method (or main) header and the offsets of its body in the source
+
+    The body is only sliced out of the source when it is read, so a parsed
+    class holds names and offsets rather than a copy of every body. lines
+    is (header line, opening brace line, closing brace line).
+    """
+
+    __slots__ = ("modifier", "return_type", "name", "params", "source", "body_start", "body_end", "lines")
+
+    def __init__(self, modifier, return_type, name, params, source, body_start, body_end, lines):
+        self.modifier = modifier
+        self.return_type = return_type
+        self.name = name
+        self.params = params
+        self.source = source
+        self.body_start = body_start
+        self.body_end = body_end
+        self.lines = lines
+
+    @property
+    def body(self):
+        return decode_source(self.source[self.body_start:self.body_end])
+
+    def key(self):
+        """The parts of the method that its translation depends on"""
+        return self.modifier, self.return_type, self.name, self.params, self.body
+
+    def detached(self):
+        """A copy that owns only its body, to send to another process or keep past the source"""
+        body = self.body
+        return MethodDecl(self.modifier, self.return_type, self.name, self.params, body, 0, len(body), self.lines)
+
+    def statement_lines(self, body=None):
+        """Java line of every non-blank line of the body"""
+        body = self.body if body is None else body
+        body_line = self.lines[1]
+        return [body_line + number for number, line in enumerate(body.split('\n')) if line.strip()]
+
+
+class ClassDecl:
+    """The units extract_units() found in one class: fields, methods and main
+
+    name is None for code outside a public class, main a MethodDecl or None.
+    """
+
+    __slots__ = ("name", "fields", "methods", "main")
+
+    def __init__(self, name, fields=None, methods=None, main=None):
+        self.name = name
+        self.fields = fields if fields is not None else []
+        self.methods = methods if methods is not None else []
+        self.main = main
@@ -0,0 +1,74 @@
+import time
+from contextlib import contextmanager
+
+# Modes accepted by profile_call
+PROFILE_MODES = ("cprofile", "tracemalloc")
+
+
+class PhaseTimer:
+    """Wall time per translation phase
+
+    Phases can nest (body conversion runs inside code emission); time spent
+    in a nested phase is only counted for that phase, so the totals add up
+    to the time of the outermost phases.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.nested = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        self.nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self.nested.pop()
+            self.totals[name] = self.totals.get(name, 0.0) + elapsed - nested
+            if self.nested:
+                self.nested[-1] += elapsed
+
+    def summary(self, limit=3):
+        """Short text naming the slowest phases, for a status bar"""
+        slowest = sorted(self.totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in slowest)
+
+
+def profile_call(function, mode, output_path):
+    """Run function() under cProfile or tracemalloc and dump the results
+
+    cprofile writes a pstats file to output_path plus a text listing of the
+    top functions next to it; tracemalloc writes a snapshot file plus the
+    top allocation sites. Returns function()'s result.
+    """
+    # Imported here: the translator imports this module, and pstats alone
+    # would add more to its import time than the rest of the engine
+    if mode == "cprofile":
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        result = profiler.runcall(function)
+        profiler.dump_stats(output_path)
+        with open(output_path + ".txt", 'w') as file:
+            pstats.Stats(profiler, stream=file).sort_stats("cumulative").print_stats(40)
+        return result
+
+    if mode == "tracemalloc":
+        import tracemalloc
+        tracemalloc.start(25)
+        try:
+            result = function()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        snapshot.dump(output_path)
+        with open(output_path + ".txt", 'w') as file:
+            file.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n\n")
+            for stat in snapshot.statistics("lineno")[:40]:
+                file.write(f"{stat}\n")
+        return result
+
+    raise ValueError(f"Unknown profile mode: {mode}")
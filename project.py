@@ -0,0 +1,177 @@
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from braces import BraceIndex
+from fileio import atomic_write, find_java_files
+from translator import METHOD_HEADER_PATTERN
+
+# Bump when the stored layout changes; older index files are rebuilt
+INDEX_VERSION = 1
+
+# File name of the index when no path is given
+DEFAULT_INDEX_NAME = ".coffee2go-index.json"
+
+# class/interface/enum declarations up to the opening brace of their body
+TYPE_HEADER_PATTERN = re.compile(r'\b(class|interface|enum)\s+(\w+)[^{;()]*\{')
+
+# Field declarations; only matches at class-body depth are used
+FIELD_DECLARATION_PATTERN = re.compile(
+    r'(?:(?:public|private|protected|static|final|transient|volatile)\s+)*(\w+)\s+(\w+)\s*(?:=[^;]*)?;'
+)
+
+# Words that can precede a name like a return type but make it a constructor or statement
+NOT_A_TYPE = {"public", "private", "protected", "static", "final", "abstract", "new", "return", "else"}
+
+
+def extract_symbols(java_code):
+    """Return a record per class, interface and enum declared in a Java file
+
+    Each record is {"name", "kind", "fields": [[type, name], ...],
+    "methods": [[name, return type, params], ...]}. Members are taken at the
+    depth of the type's own body, so nested types and method locals do not
+    leak into their enclosing class.
+    """
+    brace_index = BraceIndex(java_code)
+    records = []
+    for header in TYPE_HEADER_PATTERN.finditer(java_code):
+        open_position = header.end() - 1
+        close_position = brace_index.closing_brace(open_position)
+        if close_position < 0:
+            continue  # Inside a string or comment, or never closed
+        member_depth = brace_index.depth_at(open_position) + 1
+
+        fields = []
+        for match in FIELD_DECLARATION_PATTERN.finditer(java_code, open_position + 1, close_position):
+            field_type, field_name = match.groups()
+            if field_type in NOT_A_TYPE or brace_index.depth_at(match.start()) != member_depth:
+                continue
+            fields.append([field_type, field_name])
+
+        methods = []
+        for match in METHOD_HEADER_PATTERN.finditer(java_code, open_position + 1, close_position):
+            _, return_type, method_name, params = match.groups()
+            if return_type in NOT_A_TYPE or brace_index.depth_at(match.start()) != member_depth:
+                continue
+            methods.append([method_name, return_type, " ".join(params.split())])
+
+        records.append({
+            "name": header.group(2),
+            "kind": header.group(1),
+            "fields": fields,
+            "methods": methods,
+        })
+    return records
+
+
+def index_file(job):
+    """Extract the symbols of one file (runs in a worker)
+
+    Returns (relative_path, mtime_ns, size, records), with records None if
+    the file could not be read.
+    """
+    src_dir, relative_path = job
+    path = os.path.join(src_dir, relative_path)
+    try:
+        stat = os.stat(path)
+        with open(path, 'rb') as file:
+            java_code = file.read().decode('utf-8', errors='replace')
+    except OSError:
+        return relative_path, 0, 0, None
+    return relative_path, stat.st_mtime_ns, stat.st_size, extract_symbols(java_code)
+
+
+class SymbolIndex:
+    """Classes, fields and method signatures of every file in a source tree
+
+    The index is kept per file together with the file's mtime and size, so
+    update() only re-reads files that changed. It is stored as compact JSON
+    and translation only needs the name -> kind table from type_kinds().
+    """
+
+    def __init__(self):
+        # relative path -> [mtime_ns, size, records]
+        self.files = {}
+        # class name -> (relative path, record); the first file in path order wins
+        self.classes = {}
+
+    @classmethod
+    def load(cls, path):
+        """Read an index file; a missing, damaged or outdated file gives an empty index"""
+        index = cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return index
+        if data.get("version") != INDEX_VERSION:
+            return index
+        index.files = data.get("files", {})
+        index.rebuild_classes()
+        return index
+
+    def save(self, path):
+        """Write the index atomically"""
+        with atomic_write(path) as file:
+            json.dump({"version": INDEX_VERSION, "files": self.files}, file, separators=(",", ":"))
+
+    def update(self, src_dir, jobs=None):
+        """Bring the index in line with the .java files below src_dir
+
+        Only new and changed files are parsed, on jobs worker processes.
+        Returns a dict with the number of files indexed, unchanged and removed.
+        """
+        current = {}
+        for path in find_java_files(src_dir):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            current[os.path.relpath(path, src_dir)] = (stat.st_mtime_ns, stat.st_size)
+
+        removed = [path for path in self.files if path not in current]
+        for path in removed:
+            del self.files[path]
+
+        changed = [
+            path for path, (mtime, size) in current.items()
+            if path not in self.files or self.files[path][:2] != [mtime, size]
+        ]
+        work = [(src_dir, path) for path in changed]
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(work) <= 1:
+            results = [index_file(job) for job in work]
+        else:
+            chunksize = max(1, len(work) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(index_file, work, chunksize=chunksize))
+
+        for path, mtime, size, records in results:
+            if records is None:
+                self.files.pop(path, None)
+            else:
+                self.files[path] = [mtime, size, records]
+        self.rebuild_classes()
+        return {
+            "indexed": len(changed),
+            "unchanged": len(current) - len(changed),
+            "removed": len(removed),
+        }
+
+    def rebuild_classes(self):
+        self.classes = {}
+        for path in sorted(self.files):
+            for record in self.files[path][2]:
+                self.classes.setdefault(record["name"], (path, record))
+
+    def lookup(self, class_name):
+        """Return (relative path, record) for a class name, or None"""
+        return self.classes.get(class_name)
+
+    def type_kinds(self):
+        """Return {class name: kind} for every indexed type"""
+        return {name: record["kind"] for name, (_, record) in self.classes.items()}
+
+    def __len__(self):
+        return len(self.classes)
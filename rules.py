@@ -0,0 +1,307 @@
+import re
+import time
+
+# Escapes in a replacement template: group references (\1 or \g<1>) or escaped characters
+TEMPLATE_ESCAPE_PATTERN = re.compile(r'\\(?:g<(\d+)>|(\d+)|(.))', re.DOTALL)
+TEMPLATE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\"}
+
+
+class Rule:
+    """A single regex rewrite, compiled once"""
+
+    def __init__(self, name, pattern, replacement, flags=0):
+        self.name = name
+        self.pattern = pattern
+        self.replacement = replacement
+        self.flags = flags
+        self.regex = re.compile(pattern, flags)
+
+
+class RuleGroup:
+    """Rules that do not interfere with each other, applied in one combined scan
+
+    The rule patterns are joined into a single alternation and every rule
+    ends in its own empty named group, so the match callback can tell from
+    match.lastgroup which rule fired. Pattern text shared by all rules at
+    the front (such as a common receiver group) is matched only once, and
+    the markers go last so each alternative still starts with its literal
+    text, which lets re skip ahead quickly.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        if len(rules) == 1:
+            # Nothing to combine, let re.sub expand the template itself
+            self.regex = rules[0].regex
+            self.replacement = rules[0].replacement
+            return
+
+        prefix = shared_prefix(rules)
+        prefix_groups = re.compile(prefix).groups if prefix else 0
+
+        parts = []
+        self.templates = {}
+        group_offset = prefix_groups
+        for index, rule in enumerate(rules):
+            marker = f"_r{index}"
+            pattern = rule.pattern[len(prefix):]
+            if rule.flags:
+                pattern = f"(?{flag_letters(rule.flags)}:{pattern})"
+            parts.append(f"{pattern}(?P<{marker}>)")
+
+            def renumber(number, base=group_offset - prefix_groups):
+                return number if number <= prefix_groups else number + base
+            self.templates[marker] = compile_template(rule.replacement, renumber)
+            group_offset += rule.regex.groups - prefix_groups + 1
+
+        self.regex = re.compile(f"{prefix}(?:{'|'.join(parts)})")
+        self.replacement = self.dispatch
+
+    def dispatch(self, match):
+        literals, groups = self.templates[match.lastgroup]
+        if not groups:
+            return literals[0]
+        values = match.group(*groups) if len(groups) > 1 else (match.group(groups[0]),)
+        parts = [literals[0]]
+        for value, literal in zip(values, literals[1:]):
+            parts.append(value or "")
+            parts.append(literal)
+        return "".join(parts)
+
+    def apply(self, text):
+        return self.regex.sub(self.replacement, text)
+
+    def apply_counted(self, text):
+        """apply(), also returning the number of matches of each rule in order"""
+        if len(self.rules) == 1:
+            text, count = self.regex.subn(self.replacement, text)
+            return text, [count]
+        counts = dict.fromkeys(self.templates, 0)
+
+        def counted(match):
+            counts[match.lastgroup] += 1
+            return self.dispatch(match)
+        text = self.regex.sub(counted, text)
+        return text, [counts[f"_r{index}"] for index in range(len(self.rules))]
+
+
+class RulePipeline:
+    """An ordered list of rule groups; each group costs one pass over the text"""
+
+    def __init__(self, name, stages):
+        self.name = name
+        self.groups = []
+        for stage in stages:
+            self.groups.append(RuleGroup([Rule(*rule) for rule in stage]))
+
+    @property
+    def rules(self):
+        return [rule for group in self.groups for rule in group.rules]
+
+    def apply(self, text, stats=None):
+        """Run every group over the text and return (text, number of passes)
+
+        With a RuleStats as stats, every pass is timed and its matches are
+        counted per rule, at the cost of a Python callback per match.
+        """
+        if stats is not None:
+            for number, group in enumerate(self.groups):
+                start = time.perf_counter()
+                scanned = len(text)
+                text, counts = group.apply_counted(text)
+                stats.add_pass(self.name, number, group.rules, counts, scanned, time.perf_counter() - start)
+            return text, len(self.groups)
+        for group in self.groups:
+            text = group.apply(text)
+        return text, len(self.groups)
+
+
+# Columns of RuleStats.as_rows(), in CSV order
+RULE_STAT_FIELDS = ("pipeline", "pass", "rule", "rules_in_pass", "matches", "chars_scanned", "seconds")
+
+
+class RuleStats:
+    """Match counts and scan cost of every rule, summed over any number of translations
+
+    Rules that share a pass are matched in one combined scan, so the text
+    scanned and the time are per pass: each rule of the pass reports the
+    pass totals, and rules_in_pass says how many rules share them.
+    """
+
+    def __init__(self):
+        # (pipeline, pass, rule) -> [rules in pass, matches, characters scanned, seconds]
+        self.totals = {}
+
+    def __len__(self):
+        return len(self.totals)
+
+    def add_pass(self, pipeline, number, rules, counts, scanned, seconds):
+        for rule, count in zip(rules, counts):
+            self.add(pipeline, number, rule.name, len(rules), count, scanned, seconds)
+
+    def add(self, pipeline, number, rule, rules_in_pass, matches, scanned, seconds):
+        entry = self.totals.get((pipeline, number, rule))
+        if entry is None:
+            self.totals[(pipeline, number, rule)] = [rules_in_pass, matches, scanned, seconds]
+        else:
+            entry[1] += matches
+            entry[2] += scanned
+            entry[3] += seconds
+
+    def merge(self, rows):
+        """Add rows from as_rows() of another RuleStats, such as one from a worker process"""
+        for row in rows:
+            self.add(row["pipeline"], row["pass"], row["rule"], row["rules_in_pass"],
+                     row["matches"], row["chars_scanned"], row["seconds"])
+
+    def as_rows(self):
+        """One dict per rule with the RULE_STAT_FIELDS, in pipeline and pass order"""
+        return [
+            dict(zip(RULE_STAT_FIELDS, key + tuple(entry)))
+            for key, entry in sorted(self.totals.items())
+        ]
+
+    def unmatched(self):
+        """Names of the rules that never matched, as pipeline/rule"""
+        return [f"{pipeline}/{rule}" for (pipeline, _, rule), entry in sorted(self.totals.items()) if not entry[1]]
+
+
+def flag_letters(flags):
+    """Return the inline flag letters for the given re flags"""
+    letters = ""
+    for flag, letter in ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x")):
+        if flags & flag:
+            letters += letter
+    return letters
+
+
+def shared_prefix(rules):
+    """Return the longest pattern text every rule starts with that can be matched on its own"""
+    if any(rule.flags for rule in rules):
+        return ""
+    patterns = [rule.pattern for rule in rules]
+    length = 0
+    shortest = min(patterns, key=len)
+    while length < len(shortest) and all(p[length] == shortest[length] for p in patterns):
+        length += 1
+
+    # Back off until the prefix is a complete pattern that no rule quantifies further
+    while length:
+        prefix = shortest[:length]
+        if not prefix.endswith("\\") and "|" not in prefix and all(p[length:length + 1] not in "*+?{" or len(p) == length for p in patterns):
+            try:
+                re.compile(prefix)
+                return prefix
+            except re.error:
+                pass
+        length -= 1
+    return ""
+
+
+def compile_template(template, renumber):
+    """Split a replacement template into literal text and group numbers
+
+    Returns (literals, groups) where literals has one more entry than
+    groups and the expansion is literals[0] + group + literals[1] + ...
+    Group numbers are passed through renumber so they point into a
+    combined pattern. Parsing this once avoids re-reading the template
+    per match.
+    """
+    literals = []
+    groups = []
+    current = ""
+    position = 0
+    for match in TEMPLATE_ESCAPE_PATTERN.finditer(template):
+        current += template[position:match.start()]
+        position = match.end()
+        number = match.group(1) or match.group(2)
+        if number is not None:
+            literals.append(current)
+            groups.append(renumber(int(number)))
+            current = ""
+        else:
+            char = match.group(3)
+            current += TEMPLATE_ESCAPES.get(char, "\\" + char)
+    literals.append(current + template[position:])
+    return literals, groups
+
+
+# Rules used by convert_java_body_to_go. Each inner list is one pass. Rules
+# only share a pass when a match of one can never overlap a match of another,
+# string literals included. Anything else keeps its own pass, so the result
+# is the same as applying the rules one after another. The System.out rules
+# cannot nest as code, but System.out.print("System.out.println(x);") holds
+# one in a string that sequential application rewrites too. The if/while/for
+# rules look independent but are not: a lazy (.*?) runs on to the first ") {"
+# it finds, so "while (a) x(); if (b) {" lets the while rule swallow the start
+# of the if. tests/test_rules.py compares the pipelines against sequential
+# application.
+# Patterns that start with a word are anchored at a word start: they match
+# the same text, but re no longer retries them from inside every word.
+BODY_STAGES = [
+    # System.out conversions; one can sit in a string literal passed to another
+    [("println", r'System\.out\.println\((.*?)\);', r'fmt.Println(\1)')],
+    [("print", r'System\.out\.print\((.*?)\);', r'fmt.Print(\1)')],
+    [("printf", r'System\.out\.printf\((.*?)\);', r'fmt.Printf(\1)')],
+    # String concatenation with + to fmt.Sprintf
+    [("concat_left", r'(".*?")\s*\+\s*([\w\.]+)', r'fmt.Sprintf("%s%v", \1, \2)')],
+    [("concat_right", r'(?<![\w.])([\w\.]+)\s*\+\s*(".*?")', r'fmt.Sprintf("%v%s", \1, \2)')],
+    # Variable declarations
+    [("var_decl", r'\b(\w+)\s+(\w+)\s*=\s*(.*?);', r'\2 := \3')],
+    # Method calls on objects
+    [("method_call", r'\b(\w+)\.(\w+)\((.*?)\);', r'\1.\2(\3)')],
+    # Control structures; their captures can run into the next statement, one pass each
+    [("if", r'if\s*\((.*?)\)\s*\{', r'if \1 {')],
+    [("while", r'while\s*\((.*?)\)\s*\{', r'for \1 {')],
+    [("for", r'for\s*\((\w+)\s+(\w+)\s*=\s*(\w+);\s*(\w+)\s*([<>=!]+)\s*(\w+);\s*(\w+)(\+\+|\-\-|\+=1|\-=1)\)\s*\{',
+      r'for \2 := \3; \4 \5 \6; \7\8 {')],
+    # Return statements
+    [("return", r'return\s+(.*?);', r'return \1')],
+    # New object creation
+    [("new", r'new\s+(\w+)\((.*?)\)', r'\1{\2}')],
+    [("new_assign", r'\b(\w+)\s+(\w+)\s*=\s*new\s+(\w+)\((.*?)\);', r'\2 := &\3{\4}')],
+    # Remove semicolons
+    [("semicolon", r';', '')],
+]
+
+# Rules used by cleanup_code
+CLEANUP_STAGES = [
+    # Remove extra semicolons (Go doesn't need them)
+    [("semicolon", r';', '')],
+    # Fix braces formatting
+    [("else", r'\}\s*else', '} else')],
+    # Fix System.out.println that might have been missed
+    [("println", r'System\.out\.println\((.*?)\)', r'fmt.Println(\1)')],
+    [("print", r'System\.out\.print\((.*?)\)', r'fmt.Print(\1)')],
+    [("printf", r'System\.out\.printf\((.*?)\)', r'fmt.Printf(\1)')],
+    # Replace Java specific String operations; equals takes any argument, so it
+    # gets its own pass, the others cannot contain each other
+    [("equals", r'(?<![\w.])([\w\.]+)\.equals\((.*?)\)', r'\1 == \2')],
+    [
+        ("length", r'(?<![\w.])([\w\.]+)\.length\(\)', r'len(\1)'),
+        ("char_at", r'(?<![\w.])([\w\.]+)\.charAt\((\d+)\)', r'\1[\2]'),
+        ("to_lower", r'(?<![\w.])([\w\.]+)\.toLowerCase\(\)', r'strings.ToLower(\1)'),
+        ("to_upper", r'(?<![\w.])([\w\.]+)\.toUpperCase\(\)', r'strings.ToUpper(\1)'),
+        ("substring_range", r'(?<![\w.])([\w\.]+)\.substring\((\d+),\s*(\d+)\)', r'\1[\2:\3]'),
+        ("substring_from", r'(?<![\w.])([\w\.]+)\.substring\((\d+)\)', r'\1[\2:]'),
+    ],
+    # Fix variable declarations with types
+    [("var_decl", r'\b(\w+)\s+(\w+)\s*=', r'\2 :=')],
+    # Fix for loops
+    [("for", r'for\s*\((\w+)\s+(\w+)\s*=\s*(\w+);\s*(\w+)\s*([<>=!]+)\s*(\w+);\s*(\w+)(\+\+|\-\-|\+=1|\-=1)\)',
+      r'for \2 := \3; \4 \5 \6; \7\8')],
+    # Convert common conversions; these nest inside each other, so one pass each
+    [("parse_int", r'Integer\.parseInt\((.*?)\)', r'strconv.Atoi(\1)')],
+    [("parse_double", r'Double\.parseDouble\((.*?)\)', r'strconv.ParseFloat(\1, 64)')],
+    [("parse_boolean", r'Boolean\.parseBoolean\((.*?)\)', r'strconv.ParseBool(\1)')],
+    # Exception handling
+    [("try_catch", r'try\s*\{([\s\S]*?)\}\s*catch\s*\((.*?)\)\s*\{([\s\S]*?)\}',
+      r'// Error handling in Go style\n\1\nif err != nil {\n\3\n}')],
+    # Fix comments
+    [("comment", r'//(.*?)$', r'// \1', re.MULTILINE)],
+    # Cleanup empty braces
+    [("empty_braces", r'\{\s*\}', r'{\n}')],
+]
+
+BODY_PIPELINE = RulePipeline("body", BODY_STAGES)
+CLEANUP_PIPELINE = RulePipeline("cleanup", CLEANUP_STAGES)
@@ -0,0 +1,280 @@
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import socketserver
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from batch import DEFAULT_TIMEOUT, run_batch
+from cache import UnitCache
+from formatter import format_go
+from project import DEFAULT_INDEX_NAME, SymbolIndex
+from translator import JavaToGoEngine, TranslationOptions, TranslationTimeout, time_limit
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+TRANSLATION_ERROR = -32000
+
+# Warm state of a translation worker process
+worker_cache = None
+worker_types = {}
+
+
+class RequestError(Exception):
+    """A request failed; code and message go into the JSON-RPC error object"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def init_worker(types):
+    """Pool initializer: give each worker its own unit cache and the project types"""
+    global worker_cache, worker_types
+    worker_cache = UnitCache()
+    worker_types = types
+
+
+def warm_up():
+    """Make sure a worker process is started (rules are compiled on import)"""
+    return os.getpid()
+
+
+def translate_in_worker(java_code, options, timeout):
+    """Translate with the worker's cache; runs in a pool process"""
+    engine = JavaToGoEngine(options, cache=worker_cache, types=worker_types)
+    hits = worker_cache.hits
+    with time_limit(timeout):
+        go_code = engine.translate(java_code)
+    report = engine.translation_report()
+    report["cached_units"] = worker_cache.hits - hits
+    return go_code, report
+
+
+def options_from_params(params):
+    try:
+        return TranslationOptions(**params.get("options", {}))
+    except TypeError as e:
+        raise RequestError(INVALID_PARAMS, str(e))
+
+
+def required_param(params, name):
+    if name not in params:
+        raise RequestError(INVALID_PARAMS, f"Missing parameter: {name}")
+    return params[name]
+
+
+class TranslationServer:
+    """Keeps warm translation workers and answers JSON-RPC requests
+
+    Requests are handled on a thread pool so several can be in flight at
+    once; translations run on a pool of worker processes that keep their
+    compiled rules, unit caches and the project's types between requests.
+    """
+
+    def __init__(self, workers=None, timeout=DEFAULT_TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.types = {}
+        self.pool = None
+        self.pool_lock = threading.Lock()
+        self.dispatcher = ThreadPoolExecutor(max_workers=self.workers * 2)
+        self.stopped = threading.Event()
+        self.start_pool()
+
+    def start_pool(self):
+        """(Re)start the worker processes with the current project types"""
+        with self.pool_lock:
+            old_pool = self.pool
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker, initargs=(self.types,))
+            for future in [self.pool.submit(warm_up) for _ in range(self.workers)]:
+                future.result()
+        if old_pool is not None:
+            old_pool.shutdown(wait=True)
+
+    def close(self):
+        self.stopped.set()
+        self.dispatcher.shutdown(wait=True)
+        self.pool.shutdown(wait=True)
+
+    def parse_line(self, line):
+        """Decode one line of JSON-RPC; returns (request, None) or (None, error response)"""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return None, self.error_response(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            request_id = request.get("id") if isinstance(request, dict) else None
+            return None, self.error_response(request_id, INVALID_REQUEST, "Invalid request")
+        return request, None
+
+    def handle_request(self, request):
+        """Run one request; returns the response line, or None for a notification"""
+        request_id = request.get("id")
+        params = request.get("params") or {}
+        try:
+            if not isinstance(params, dict):
+                raise RequestError(INVALID_PARAMS, "params must be an object")
+            handler = getattr(self, "rpc_" + request["method"], None)
+            if handler is None:
+                raise RequestError(METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            result = handler(params)
+        except RequestError as e:
+            response = self.error_response(request_id, e.code, str(e))
+        except Exception as e:
+            response = self.error_response(request_id, TRANSLATION_ERROR, str(e))
+        else:
+            response = json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+        if "id" not in request:
+            return None
+        return response
+
+    def error_response(self, request_id, code, message):
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}})
+
+    def rpc_translate(self, params):
+        """{code, options?, timeout?} -> {go_code, report}"""
+        java_code = required_param(params, "code")
+        options = options_from_params(params)
+        timeout = params.get("timeout", self.timeout)
+        with self.pool_lock:
+            future = self.pool.submit(translate_in_worker, java_code, options, timeout)
+        try:
+            go_code, report = future.result()
+        except TranslationTimeout:
+            raise RequestError(TRANSLATION_ERROR, "timed out")
+        return {"go_code": go_code, "report": report}
+
+    def rpc_format(self, params):
+        """{code} -> {go_code}"""
+        return {"go_code": format_go(required_param(params, "code"))}
+
+    def rpc_batch(self, params):
+        """{src, output, jobs?, options?, timeout?, cache_dir?} -> batch summary"""
+        src = required_param(params, "src")
+        if not os.path.exists(src):
+            raise RequestError(INVALID_PARAMS, f"No such file or directory: {src}")
+        summary = run_batch(
+            src, required_param(params, "output"), jobs=params.get("jobs"),
+            options=options_from_params(params), timeout=params.get("timeout", self.timeout),
+            cache_dir=params.get("cache_dir"), types=self.types
+        )
+        del summary["reports"]
+        return summary
+
+    def rpc_project(self, params):
+        """{src, index?} -> index counts; later translations resolve the project's types"""
+        src = required_param(params, "src")
+        if not os.path.isdir(src):
+            raise RequestError(INVALID_PARAMS, f"Not a directory: {src}")
+        index_path = params.get("index") or os.path.join(src, DEFAULT_INDEX_NAME)
+        index = SymbolIndex.load(index_path)
+        counts = index.update(src)
+        index.save(index_path)
+        self.types = index.type_kinds()
+        self.start_pool()
+        counts["types"] = len(index)
+        return counts
+
+    def rpc_shutdown(self, params):
+        self.stopped.set()
+        return True
+
+    def serve_stream(self, input_stream, output_stream):
+        """Answer newline-delimited JSON-RPC requests from input_stream
+
+        Requests are handled concurrently, so responses can arrive in a
+        different order than the requests; clients match them by id. A
+        shutdown request waits for the requests before it and ends the loop.
+        """
+        write_lock = threading.Lock()
+
+        def send(response):
+            if response is not None:
+                with write_lock:
+                    output_stream.write(response + "\n")
+                    output_stream.flush()
+
+        pending = []
+        for line in input_stream:
+            if not line.strip():
+                continue
+            request, error = self.parse_line(line)
+            if error is not None:
+                send(error)
+            elif request["method"] == "shutdown":
+                for future in pending:
+                    future.result()
+                send(self.handle_request(request))
+                break
+            else:
+                pending.append(self.dispatcher.submit(lambda request: send(self.handle_request(request)), request))
+        for future in pending:
+            future.result()
+
+    def serve_socket(self, socket_path):
+        """Answer requests on a Unix domain socket, one thread per connection"""
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                input_stream = io.TextIOWrapper(self.rfile, encoding='utf-8', errors='replace')
+                output_stream = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+                try:
+                    server.serve_stream(input_stream, output_stream)
+                finally:
+                    input_stream.detach()
+                    output_stream.detach()
+                if server.stopped.is_set():
+                    threading.Thread(target=socket_server.shutdown, daemon=True).start()
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        socket_server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+        socket_server.daemon_threads = True
+        try:
+            socket_server.serve_forever()
+        finally:
+            socket_server.server_close()
+            os.remove(socket_path)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py serve",
+        description="Keep a warm translator running and answer JSON-RPC requests"
+    )
+    parser.add_argument("--socket", default=None, metavar="PATH",
+                        help="Listen on this Unix domain socket instead of stdin/stdout")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="Number of translation worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Default per-request time limit in seconds (default: {DEFAULT_TIMEOUT})")
+    return parser
+
+
+def main(argv=None):
+    """Entry point for the serve command"""
+    args = build_parser().parse_args(argv)
+    # Worker pools are started from a process that already runs threads
+    # (dispatcher, other pools), where forking can deadlock
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        multiprocessing.set_start_method("forkserver")
+    server = TranslationServer(workers=args.workers, timeout=args.timeout)
+    try:
+        if args.socket:
+            server.serve_socket(args.socket)
+        else:
+            server.serve_stream(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
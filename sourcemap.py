@@ -0,0 +1,146 @@
+import json
+import os
+from array import array
+
+from fileio import atomic_write
+
+# Bump when the sidecar layout changes
+SOURCE_MAP_VERSION = 1
+
+# Appended to the .go file name for the sidecar written by batch mode
+SOURCE_MAP_SUFFIX = ".map"
+
+
+class LineCounter:
+    """Offset -> 1-based line number of a str, bytes or mmap source
+
+    Each query counts the newlines between it and the previous one, so a
+    pass that asks for lines in (mostly) increasing order, as extraction
+    does, scans the source about once instead of once per query.
+    """
+
+    def __init__(self, code, first_line=1):
+        self.code = code
+        self.newline = '\n' if isinstance(code, str) else b'\n'
+        self.position = 0
+        self.line = first_line
+
+    def line_at(self, position):
+        if position >= self.position:
+            self.line += self.newlines(self.position, position)
+        else:
+            self.line -= self.newlines(position, self.position)
+        self.position = position
+        return self.line
+
+    def newlines(self, start, end):
+        if isinstance(self.code, (str, bytes)):
+            return self.code.count(self.newline, start, end)
+        # mmap has no count(); the slice is only as long as the step
+        return self.code[start:end].count(self.newline)
+
+
+class SourceMap:
+    """Java line range behind every line of generated Go code
+
+    Two parallel array('I') columns hold the first and last Java line
+    (1-based) of each Go line, 0 for lines with no Java source such as the
+    package clause, so a map costs 8 bytes per Go line. The Java -> Go
+    direction is built on first use.
+    """
+
+    def __init__(self):
+        self.java_first = array('I')
+        self.java_last = array('I')
+        self.go_by_java = None
+
+    def __len__(self):
+        return len(self.java_first)
+
+    def add_range(self, go_lines, first, last):
+        """Map the next go_lines Go lines to Java lines first..last"""
+        if go_lines > 0:
+            self.java_first.extend(array('I', [first]) * go_lines)
+            self.java_last.extend(array('I', [last]) * go_lines)
+            self.go_by_java = None
+
+    def prepend_unmapped(self, go_lines):
+        """Insert go_lines lines with no Java source (such as the header) before the others"""
+        self.java_first[0:0] = array('I', bytes(4 * go_lines))
+        self.java_last[0:0] = array('I', bytes(4 * go_lines))
+        self.go_by_java = None
+
+    def add_lines(self, java_lines):
+        """Map the next Go lines one to one onto java_lines"""
+        self.java_first.extend(java_lines)
+        self.java_last.extend(java_lines)
+        self.go_by_java = None
+
+    def add_block(self, go_code, header_lines, trailer_lines, method, java_body=None):
+        """Map a function emitted as header lines, one line per non-blank body line and trailer lines
+
+        method is the MethodDecl it came from; java_body saves slicing its
+        body again when the caller already has it. Body lines map one to
+        one when the conversion kept their number, and to the whole body
+        otherwise.
+        """
+        header, body_line, close = method.lines
+        body_lines = go_code.count('\n') - header_lines - trailer_lines
+        self.add_range(header_lines, header, body_line)
+        java_lines = method.statement_lines(java_body)
+        if len(java_lines) == body_lines:
+            self.add_lines(java_lines)
+        else:
+            self.add_range(body_lines, body_line, close)
+        self.add_range(trailer_lines, close, close)
+
+    def java_range(self, go_line):
+        """Return (first, last) Java lines of a 1-based Go line, or None"""
+        if not 0 < go_line <= len(self.java_first) or not self.java_first[go_line - 1]:
+            return None
+        return self.java_first[go_line - 1], self.java_last[go_line - 1]
+
+    def go_line(self, java_line):
+        """Return the first Go line generated from java_line or the closest line before it, or None"""
+        if self.go_by_java is None:
+            self.build_reverse()
+        if not self.go_by_java:
+            return None
+        go_line = self.go_by_java[min(max(java_line, 0), len(self.go_by_java) - 1)]
+        return go_line or None
+
+    def build_reverse(self):
+        size = max(self.java_last, default=0) + 1
+        reverse = array('I', bytes(4 * size))
+        for go_line, first in enumerate(self.java_first, 1):
+            if first and (not reverse[first] or go_line < reverse[first]):
+                reverse[first] = go_line
+        # Java lines inside a range lead to the Go line of the nearest line above
+        for java_line in range(1, size):
+            if not reverse[java_line]:
+                reverse[java_line] = reverse[java_line - 1]
+        self.go_by_java = reverse
+
+    def as_dict(self, go_file=None, java_file=None):
+        """The map as the JSON sidecar layout: both columns as lists, one entry per Go line"""
+        return {
+            "version": SOURCE_MAP_VERSION,
+            "file": go_file,
+            "source": java_file,
+            "java_first": self.java_first.tolist(),
+            "java_last": self.java_last.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        source_map = cls()
+        source_map.java_first = array('I', data["java_first"])
+        source_map.java_last = array('I', data["java_last"])
+        return source_map
+
+    def save(self, path, java_path=None):
+        """Write the map as a compact JSON sidecar of the Go file at path[:-len(SOURCE_MAP_SUFFIX)]"""
+        go_file = os.path.basename(path[:-len(SOURCE_MAP_SUFFIX)] if path.endswith(SOURCE_MAP_SUFFIX) else path)
+        java_file = os.path.relpath(java_path, os.path.dirname(path) or ".") if java_path else None
+        with atomic_write(path) as file:
+            json.dump(self.as_dict(go_file, java_file), file, separators=(",", ":"))
@@ -0,0 +1,13 @@
+import pytest
+
+from batch import main
+
+
+def test_stdout_output_rejects_flags_that_write_files(tmp_path, capsys):
+    path = tmp_path / "A.java"
+    path.write_text("public class A { private int x; }\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(path), "-o", "-", "--report", str(tmp_path / "report.json")])
+    assert exit_info.value.code == 2
+    assert "--report cannot be used with -o -" in capsys.readouterr().err
+    assert not (tmp_path / "report.json").exists()
@@ -0,0 +1,6 @@
+from benchmark import main
+
+
+def test_missing_baseline_fails_the_run(tmp_path, capsys):
+    assert main(["--baseline", str(tmp_path / "missing.json")]) == 2
+    assert "No baseline" in capsys.readouterr().err
@@ -0,0 +1,122 @@
+import io
+
+import pytest
+
+from braces import BraceIndex, iter_type_declarations
+
+
+def brace_offsets(code):
+    return sorted(code.index(marker) for marker in ("{A", "}A", "{B", "}B") if marker in code)
+
+
+def assert_braces(code):
+    """The real braces of code are marked {A }A {B }B, every other brace is hidden in a token"""
+    index = BraceIndex(code)
+    assert list(index.positions) == brace_offsets(code)
+    assert list(BraceIndex(code.encode()).positions) == list(index.positions)
+    return index
+
+
+@pytest.mark.parametrize("code", [
+    'class X {A String s = "{ } \\" {"; }A',
+    "class X {A char a = '{'; char b = '}'; char q = '\\''; char c = '{'; }A",
+    'class X {A // a { in a comment\n int x; }A',
+    'class X {A /* { multi\n } line */ int x; /**/ }A',
+    'class X {A String s = """\n    { text\n    block \\""" }\n    """; void f() {B }B }A',
+    'class X {A String s = """\n    "quoted" and ""twice"" {\n    """; }A',
+    'class X {A String url = "http://x"; String c = "/*"; void f() {B }B }A',
+])
+def test_braces_in_literals_and_comments_are_skipped(code):
+    assert_braces(code)
+
+
+def test_depths_and_partners():
+    code = 'class X {A void f() {B }B }A'
+    index = assert_braces(code)
+    outer_open, inner_open, inner_close, outer_close = brace_offsets(code)
+    assert list(index.depths) == [1, 2, 1, 0]
+    assert index.depth_at(0) == 0
+    assert index.depth_at(inner_open) == 1
+    assert index.depth_at(inner_open + 1) == 2
+    assert index.depth_at(len(code)) == 0
+    assert index.closing_brace(outer_open) == outer_close
+    assert index.closing_brace(inner_open) == inner_close
+    # Only offsets of opening braces have a partner
+    assert index.closing_brace(outer_close) == -1
+    assert index.closing_brace(outer_open + 1) == -1
+
+
+def test_spans_at_depth():
+    code = 'class X { int a; void f() { x(); } int b; }'
+    spans = list(BraceIndex(code).spans_at_depth(1, len(code)))
+    assert [code[start:end] for start, end in spans] == [' int a; void f() {', ' int b; }']
+
+
+@pytest.mark.parametrize("code", [
+    'class X { void f() {',                # never closed
+    'class X { } }',                       # one closing brace too many
+    'class X { String s = "unterminated\n void f() { }',
+    'class X { /* unterminated { }',
+    'class X { String s = """\n { }',
+])
+def test_unbalanced_input(code):
+    index = BraceIndex(code)
+    for position in index.positions:
+        if code[position] == '{':
+            closing = index.closing_brace(position)
+            assert closing == -1 or code[closing] == '}'
+    assert len(index) == len(BraceIndex(code.encode()))
+
+
+def test_unbalanced_braces_have_no_partner():
+    code = 'class X { void f() {'
+    index = BraceIndex(code)
+    assert index.closing_brace(code.index('{')) == -1
+    assert list(index.depths) == [1, 2]
+
+    code = '} class X { }'
+    index = BraceIndex(code)
+    assert list(index.depths) == [-1, 0, -1]
+    assert index.closing_brace(code.index('{')) == code.rindex('}')
+
+
+def test_unterminated_tokens_hide_the_rest_of_the_line_or_file():
+    code = 'String s = "open { \n int x; {A }A'
+    assert_braces(code)
+    code = '/* open { \n int x; { }'
+    assert len(BraceIndex(code)) == 0
+
+
+DECLARATIONS = '''package demo;
+
+import java.util.List;
+
+/* a { comment */
+class Helper {
+    String s = "}\\" {";
+    char c = '{';
+    String block = """
+        { "" }
+        """;
+}
+
+// } public class Fake {
+public class Main {
+    void f() { if (x) { y(); } }
+}
+
+interface Named { String name(); }
+'''
+
+
+def test_declarations_split_the_same_at_every_chunk_boundary():
+    expected = list(iter_type_declarations(io.StringIO(DECLARATIONS), len(DECLARATIONS) * 2))
+    assert [(kind, name) for kind, name, _, _ in expected] == [
+        ("class", "Helper"), ("class", "Main"), ("interface", "Named")
+    ]
+    assert "".join(text for _, _, text, _ in expected) == DECLARATIONS.rstrip("\n")
+    assert [first_line for _, _, _, first_line in expected] == [1, 12, 17]
+
+    # Small chunks put the boundary inside every token: comments, literals, text blocks, escapes
+    for chunk_size in range(1, 40):
+        assert list(iter_type_declarations(io.StringIO(DECLARATIONS), chunk_size)) == expected, chunk_size
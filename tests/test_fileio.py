@@ -0,0 +1,50 @@
+import os
+import threading
+
+import pytest
+
+from fileio import atomic_write
+
+
+def test_atomic_write_replaces_the_file_and_leaves_no_temporary_files(tmp_path):
+    path = tmp_path / "out" / "A.go"
+    with atomic_write(str(path)) as file:
+        file.write("old")
+    with atomic_write(str(path)) as file:
+        file.write("new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert os.listdir(tmp_path / "out") == ["A.go"]
+
+
+def test_atomic_write_keeps_the_old_file_when_writing_fails(tmp_path):
+    path = tmp_path / "A.go"
+    path.write_text("old", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path)) as file:
+            file.write("partial")
+            raise RuntimeError("failed")
+    assert path.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["A.go"]
+
+
+def test_atomic_write_from_concurrent_threads(tmp_path):
+    path = str(tmp_path / "index.json")
+    errors = []
+
+    def write(number):
+        try:
+            for _ in range(50):
+                with atomic_write(path) as file:
+                    file.write(str(number) * 10000)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    text = open(path, encoding="utf-8").read()
+    assert len(text) == 10000 and len(set(text)) == 1
+    assert os.listdir(tmp_path) == ["index.json"]
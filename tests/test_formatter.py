@@ -0,0 +1,14 @@
+from formatter import format_go
+
+
+def test_format_go_is_idempotent():
+    go_code = 'func a() {\nx\nif y {\nz\n}\n}\n'
+    formatted = format_go(go_code)
+    assert formatted == 'func a() {\n\tx\n\tif y {\n\t\tz\n\t}\n}\n'
+    assert format_go(formatted) == formatted
+
+
+def test_format_go_keeps_blank_lines_and_ends_in_one_newline():
+    formatted = format_go('package main\n\nfunc a() {\n}')
+    assert formatted == 'package main\n\nfunc a() {\n}\n'
+    assert format_go(formatted) == formatted
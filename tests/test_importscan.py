@@ -0,0 +1,39 @@
+import pytest
+
+from importscan import GO_IMPORT_TRIGGERS, GO_IMPORTS, ImportDetector
+
+
+@pytest.mark.parametrize("go_code", [
+    'x := "fmt.Println(strings.ToUpper(s))"',
+    'x := "escaped \\" fmt.Println"',
+    'x := `raw fmt.Println\nstrings.Join`',
+    "r := 'f' // fmt.Println(x)",
+    '/* strings.ToLower(s)\n fmt.Println */ x := 1',
+    's.fmt.Println(x)',
+    'x.strings.Join(a)',
+    'myfmt.Println(x)',
+    'format.X()',
+])
+def test_text_that_is_not_a_package_use_adds_no_import(go_code):
+    assert GO_IMPORTS.packages(go_code) == set()
+
+
+@pytest.mark.parametrize("token,package", sorted(GO_IMPORT_TRIGGERS.items()))
+def test_each_package_is_imported_when_used(token, package):
+    assert GO_IMPORTS.packages(f"func f() {{\n    v := {token}X(a)\n}}\n") == {package}
+
+
+def test_only_the_packages_used_in_code_are_imported():
+    go_code = (
+        'fmt.Println("strings.ToUpper") // time.Now()\n'
+        'n, err := strconv.Atoi(`os.Args`)\n'
+        'x := (math.Max(a, b))\n'
+    )
+    assert GO_IMPORTS.packages(go_code) == {"fmt", "strconv", "math"}
+    assert GO_IMPORTS.packages("") == set()
+
+
+def test_custom_triggers_sharing_a_prefix():
+    detector = ImportDetector({"str.": "str", "strings.": "strings", "strconv.": "strconv"})
+    assert detector.packages("strings.X() str.Y()") == {"strings", "str"}
+    assert detector.packages("strconv.X()") == {"strconv"}
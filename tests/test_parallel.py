@@ -0,0 +1,28 @@
+import translator
+from benchmark import generate_java_class
+from cache import UnitCache
+from translator import JavaToGoEngine
+
+
+def test_parallel_methods_match_serial(monkeypatch):
+    monkeypatch.setattr(translator, "PARALLEL_MIN_METHODS", 10)
+    java_code = generate_java_class(fields=5, methods=40, body_lines=6, strings=True)
+    serial = JavaToGoEngine()
+    expected = serial.translate(java_code)
+
+    parallel = JavaToGoEngine(jobs=2)
+    assert parallel.translate(java_code) == expected
+    assert parallel.passes == serial.passes
+    assert parallel.source_map.java_first == serial.source_map.java_first
+
+
+def test_parallel_cache_counts_match_serial(monkeypatch):
+    monkeypatch.setattr(translator, "PARALLEL_MIN_METHODS", 10)
+    java_code = generate_java_class(fields=5, methods=40, body_lines=6)
+    counts = []
+    for jobs in (1, 2):
+        cache = UnitCache()
+        JavaToGoEngine(cache=cache, jobs=jobs).translate(java_code)
+        JavaToGoEngine(cache=cache, jobs=jobs).translate(java_code)
+        counts.append((cache.hits, cache.misses))
+    assert counts[0] == counts[1]
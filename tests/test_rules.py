@@ -0,0 +1,83 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from benchmark import BENCHMARK_CASES, generate_java_class
+from rules import BODY_PIPELINE, CLEANUP_PIPELINE
+from translator import JavaToGoEngine
+
+PIPELINES = (BODY_PIPELINE, CLEANUP_PIPELINE)
+
+# Statements the fuzz test strings together, chosen to put rule matches next to each other
+STATEMENTS = [
+    'while (a) x();', 'if (b) {', '}', '} else {', 'for (int i = 0; i < n; i++) {', 'for (String w : ws) {',
+    'while (i < n) {', 'if (a) b(); else c();', 'if (x.equals("a")) return;',
+    'System.out.println(s);', 'System.out.print("a" + b);', 'System.out.printf("%d", f(x));',
+    'System.out.println("x);");', 'int v = g(a);', 'x.y(z);', 'return a;', 'String t = s.toLowerCase();',
+    'boolean e = s.equals(t);', 'int l = s.length();', 'char c = s.charAt(2);', 's = s.substring(1, 3);',
+    's = s.substring(2);', 'Foo f = new Foo(1);', 'int n = Integer.parseInt(s);', '// note;',
+    'try {', '} catch (Exception e) {', 'System.out.print("System.out.println(x);");',
+    'String u = "s.length()".toUpperCase();', 'int m = t.substring(1).length();',
+    'System.out.println("s.toLowerCase() " + s.charAt(0));',
+]
+
+
+def apply_sequentially(pipeline, text):
+    """Apply the pipeline's rules one after another, one pass per rule"""
+    for rule in pipeline.rules:
+        text = rule.regex.sub(rule.replacement, text)
+    return text
+
+
+def assert_same_as_sequential(text):
+    for pipeline in PIPELINES:
+        assert pipeline.apply(text)[0] == apply_sequentially(pipeline, text), (pipeline.name, text)
+
+
+def method_bodies(java_code):
+    """Method and main bodies of a class, as the engine passes them to the pipelines"""
+    unit = JavaToGoEngine().extract_units(java_code, "Generated")
+    bodies = [method.body for method in unit.methods]
+    if unit.main is not None:
+        bodies.append(unit.main.body)
+    return bodies
+
+
+def example_templates():
+    from gui import JavaToGoTranslator
+    holder = SimpleNamespace()
+    JavaToGoTranslator.setup_example_templates(holder)
+    return holder.templates
+
+
+def test_print_calls_inside_string_literals_are_rewritten_as_in_sequence():
+    java_code = 'System.out.print("System.out.println(x);");'
+    assert BODY_PIPELINE.apply(java_code)[0] == 'fmt.Print("fmt.Println(x)")'
+    assert_same_as_sequential(java_code)
+
+
+def test_control_structures_do_not_swallow_the_next_statement():
+    assert BODY_PIPELINE.apply('while (a) x(); if (b) {')[0] == 'while (a) x() if b {'
+    assert_same_as_sequential('while (a) x(); if (b) {')
+
+
+@pytest.mark.parametrize("name", sorted(example_templates()))
+def test_templates_match_sequential(name):
+    java_code = example_templates()[name]
+    assert_same_as_sequential(java_code)
+    for body in method_bodies(java_code):
+        assert_same_as_sequential(body)
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARK_CASES))
+def test_benchmark_cases_match_sequential(name):
+    for body in method_bodies(generate_java_class(**BENCHMARK_CASES[name])):
+        assert_same_as_sequential(body)
+
+
+def test_random_statement_sequences_match_sequential():
+    generator = random.Random(4)
+    for _ in range(3000):
+        separator = generator.choice([' ', '\n', '\n    '])
+        assert_same_as_sequential(separator.join(generator.choices(STATEMENTS, k=generator.randint(1, 6))))
@@ -0,0 +1,87 @@
+import io
+import mmap
+
+from batch import MMAP_MIN_BYTES, run_batch
+from translator import JavaToGoEngine
+
+NON_ASCII_CLASS = '''public class Ü {
+    private int größe;
+    private String name;
+
+    public int größe() {
+        return this.größe;
+    }
+
+    public void grüßen(String wer) {
+        System.out.println("Hallo " + wer);
+    }
+}
+'''
+
+
+def test_non_ascii_identifiers_on_the_bytes_path(tmp_path):
+    expected = JavaToGoEngine().translate(NON_ASCII_CLASS)
+    assert "type Ü struct" in expected and "Größe int" in expected
+    assert JavaToGoEngine().translate(NON_ASCII_CLASS.encode()) == expected
+
+    path = tmp_path / "Ü.java"
+    path.write_text(NON_ASCII_CLASS, encoding="utf-8")
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            assert JavaToGoEngine().translate(source) == expected
+
+
+def test_output_does_not_depend_on_file_size(tmp_path):
+    # Padding in a comment pushes the file over the memory-mapping threshold
+    padding = "// " + "x" * 1000 + "\n"
+    java_code = padding * (MMAP_MIN_BYTES // len(padding) + 1) + NON_ASCII_CLASS
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "Big.java").write_text(java_code, encoding="utf-8")
+
+    summary = run_batch(str(tmp_path / "src"), str(tmp_path / "out"), jobs=1)
+    assert not summary["failures"]
+    assert (tmp_path / "out" / "Big.go").read_text(encoding="utf-8") == JavaToGoEngine().translate(java_code)
+
+
+MULTI_CLASS_FILE = '''import java.util.List;
+
+class Helper {
+    private int count;
+
+    public int bump() {
+        this.count += 1;
+        return this.count;
+    }
+}
+
+public class Person {
+    private String name;
+
+    public String get() {
+        return this.name;
+    }
+}
+
+interface Named {
+    String get();
+}
+
+class Launcher {
+    public static void main(String[] args) {
+        System.out.println("start");
+    }
+}
+'''
+
+
+def test_streaming_groups_declarations_like_translate():
+    engine = JavaToGoEngine()
+    expected = engine.translate(MULTI_CLASS_FILE)
+    assert "type Person struct" in expected and "func (s *Person) get()" in expected
+
+    # A tiny chunk size makes declarations straddle reads
+    for chunk_size in (7, 1024):
+        stream_engine = JavaToGoEngine()
+        assert "".join(stream_engine.translate_stream(io.StringIO(MULTI_CLASS_FILE), chunk_size)) == expected
+        assert stream_engine.source_map.java_first == engine.source_map.java_first
+        assert stream_engine.source_map.java_last == engine.source_map.java_last
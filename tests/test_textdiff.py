@@ -0,0 +1,92 @@
+import pytest
+
+from textdiff import SMALL_DIFF_LINES, apply_hunks, changed_hunks, merge_hunks, split_lines
+
+BASE = [f"line {number}\n" for number in range(10)]
+
+
+def edited(lines, start, end, replacement):
+    lines = list(lines)
+    lines[start:end] = replacement
+    return lines
+
+
+EDITS = {
+    "insert at start": (0, 0, ["new\n"]),
+    "insert in middle": (5, 5, ["new\n", "new 2\n"]),
+    "insert at end": (10, 10, ["new\n"]),
+    "delete at start": (0, 2, []),
+    "delete in middle": (4, 6, []),
+    "delete at end": (8, 10, []),
+    "replace at start": (0, 1, ["changed\n"]),
+    "replace in middle": (3, 5, ["changed\n"]),
+    "replace at end": (9, 10, ["changed\n", "more\n"]),
+}
+
+
+@pytest.mark.parametrize("name", sorted(EDITS))
+def test_changed_hunks_turn_old_into_new(name):
+    start, end, replacement = EDITS[name]
+    new_lines = edited(BASE, start, end, replacement)
+    hunks = changed_hunks(BASE, new_lines)
+    assert hunks == [(start, end, start, start + len(replacement))]
+    assert apply_hunks(BASE, hunks, new_lines) == new_lines
+
+
+def test_changed_hunks_of_empty_inputs():
+    assert changed_hunks([], []) == []
+    assert changed_hunks([], BASE) == [(0, 0, 0, 10)]
+    assert changed_hunks(BASE, []) == [(0, 10, 0, 0)]
+    assert changed_hunks(BASE, BASE) == []
+
+
+def test_changed_hunks_come_last_first_and_apply_in_order():
+    new_lines = edited(edited(BASE, 8, 9, ["x\n"]), 1, 2, [])
+    hunks = changed_hunks(BASE, new_lines)
+    assert hunks == [(8, 9, 7, 8), (1, 2, 1, 1)]
+    assert apply_hunks(BASE, hunks, new_lines) == new_lines
+
+
+def test_changed_hunks_of_long_inputs_split_at_unique_lines():
+    # Repeated lines are not anchors, so the difflib fallback and the anchors both get used
+    old_lines = [f"func f{number}() {{\n" if number % 3 == 0 else "}\n" for number in range(SMALL_DIFF_LINES * 5)]
+    new_lines = edited(edited(old_lines, 900, 903, ["func changed() {\n"]), 30, 30, ["}\n", "}\n"])
+    hunks = changed_hunks(old_lines, new_lines)
+    assert apply_hunks(old_lines, hunks, new_lines) == new_lines
+    assert sum(end - start for start, end, _, _ in hunks) <= 3
+
+
+def test_split_lines_round_trips():
+    for text in ("", "a", "a\n", "a\nb", "a\n\nb\n"):
+        assert "".join(split_lines(text)) == text
+
+
+def test_merge_keeps_a_hand_edit_away_from_the_changes():
+    current_lines = edited(BASE, 1, 2, ["hand edit\n", "and more\n"])
+    new_lines = edited(BASE, 7, 8, ["changed\n"])
+    hunks, kept = merge_hunks(BASE, current_lines, new_lines)
+    assert kept == 1
+    assert apply_hunks(current_lines, hunks, new_lines) == edited(new_lines, 1, 2, ["hand edit\n", "and more\n"])
+
+
+def test_merge_replaces_a_hand_edit_that_overlaps_a_change():
+    current_lines = edited(BASE, 4, 5, ["hand edit\n"])
+    new_lines = edited(BASE, 3, 6, ["changed\n"])
+    hunks, kept = merge_hunks(BASE, current_lines, new_lines)
+    assert kept == 0
+    assert apply_hunks(current_lines, hunks, new_lines) == new_lines
+
+
+def test_merge_treats_touching_edits_and_changes_as_one_region():
+    current_lines = edited(BASE, 2, 3, [])
+    new_lines = edited(BASE, 3, 4, ["changed\n"])
+    hunks, kept = merge_hunks(BASE, current_lines, new_lines)
+    assert kept == 0
+    assert apply_hunks(current_lines, hunks, new_lines) == new_lines
+
+
+def test_merge_without_edits_is_the_plain_diff():
+    new_lines = edited(BASE, 5, 5, ["new\n"])
+    assert merge_hunks(BASE, BASE, new_lines) == (changed_hunks(BASE, new_lines), 0)
+    assert merge_hunks([], [], BASE) == ([(0, 0, 0, 10)], 0)
+    assert merge_hunks(BASE, BASE, BASE) == ([], 0)
@@ -0,0 +1,32 @@
+from translator import JavaToGoEngine, TranslationOptions
+
+PREFIX_FIELDS_CLASS = '''public class Person {
+    private String name;
+    private String nameList;
+
+    public String describe() {
+        return this.nameList + this.name;
+    }
+
+    public void rename(String value) {
+        this.name = value;
+        this.nameList = this.nameList + this.name;
+    }
+
+    public int count() {
+        return this.nameCount(mythis.name);
+    }
+}
+'''
+
+
+def test_field_that_prefixes_another_is_rewritten_to_the_right_field():
+    go_code = JavaToGoEngine().translate(PREFIX_FIELDS_CLASS)
+    assert "return s.NameList + s.Name\n" in go_code
+    assert "s.Name = value\n" in go_code
+    assert "s.NameList = s.NameList + s.Name\n" in go_code
+    # Only whole field names after this. are fields
+    assert "return this.nameCount(mythis.name)\n" in go_code
+
+    go_code = JavaToGoEngine(TranslationOptions(capitalize_fields=False)).translate(PREFIX_FIELDS_CLASS)
+    assert "return s.nameList + s.name\n" in go_code
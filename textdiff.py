@@ -0,0 +1,149 @@
+import re
+from bisect import bisect_left
+from collections import Counter
+from difflib import SequenceMatcher
+
+# Line ranges up to this size are diffed with difflib; larger ones are split at unique lines first
+SMALL_DIFF_LINES = 200
+
+LINE_PATTERN = re.compile(r'[^\n]*\n|[^\n]+\Z')
+
+
+def split_lines(text):
+    """Split text into lines that keep their newline, so joining them gives text back"""
+    return LINE_PATTERN.findall(text)
+
+
+def changed_hunks(old_lines, new_lines):
+    """Return (old start, old end, new start, new end) of every differing line range, last first
+
+    Ranges are first trimmed of their common head and tail, then split at
+    lines that occur exactly once on both sides (as in patience diff), so
+    a long output where a few methods changed is compared in roughly
+    linear time; only small leftover ranges go through difflib. Hunks
+    come last first so they can be applied in order without shifting the
+    line numbers of the ones still to apply.
+    """
+    hunks = []
+    ranges = [(0, len(old_lines), 0, len(new_lines))]
+    while ranges:
+        old_start, old_end, new_start, new_end = ranges.pop()
+        while old_start < old_end and new_start < new_end and old_lines[old_start] == new_lines[new_start]:
+            old_start += 1
+            new_start += 1
+        while old_start < old_end and new_start < new_end and old_lines[old_end - 1] == new_lines[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        if old_start == old_end or new_start == new_end:
+            if old_start != old_end or new_start != new_end:
+                hunks.append((old_start, old_end, new_start, new_end))
+            continue
+
+        if max(old_end - old_start, new_end - new_start) <= SMALL_DIFF_LINES:
+            matcher = SequenceMatcher(None, old_lines[old_start:old_end], new_lines[new_start:new_end], autojunk=False)
+            hunks.extend(
+                (old_start + old_first, old_start + old_stop, new_start + new_first, new_start + new_stop)
+                for tag, old_first, old_stop, new_first, new_stop in matcher.get_opcodes()
+                if tag != 'equal'
+            )
+            continue
+
+        anchors = unique_anchors(old_lines, new_lines, old_start, old_end, new_start, new_end)
+        if not anchors:
+            hunks.append((old_start, old_end, new_start, new_end))
+            continue
+        # Diff the gaps between matched unique lines
+        for old_line, new_line in anchors:
+            ranges.append((old_start, old_line, new_start, new_line))
+            old_start, new_start = old_line + 1, new_line + 1
+        ranges.append((old_start, old_end, new_start, new_end))
+
+    hunks.sort(reverse=True)
+    return hunks
+
+
+def unique_anchors(old_lines, new_lines, old_start, old_end, new_start, new_end):
+    """Longest in-order run of (old, new) positions of lines that occur once in both ranges"""
+    old_counts = Counter(old_lines[old_start:old_end])
+    new_counts = Counter(new_lines[new_start:new_end])
+    new_positions = {
+        line: position for position, line in enumerate(new_lines[new_start:new_end], new_start)
+        if new_counts[line] == 1 and old_counts[line] == 1
+    }
+    pairs = [
+        (position, new_positions[line]) for position, line in enumerate(old_lines[old_start:old_end], old_start)
+        if line in new_positions
+    ]
+
+    # Longest increasing subsequence of the new positions (patience sorting)
+    tails = []
+    tail_pairs = []
+    previous = [None] * len(pairs)
+    for index, (_, new_position) in enumerate(pairs):
+        slot = bisect_left(tails, new_position)
+        previous[index] = tail_pairs[slot - 1] if slot else None
+        if slot == len(tails):
+            tails.append(new_position)
+            tail_pairs.append(index)
+        else:
+            tails[slot] = new_position
+            tail_pairs[slot] = index
+    anchors = []
+    index = tail_pairs[-1] if tail_pairs else None
+    while index is not None:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def merge_hunks(base_lines, current_lines, new_lines):
+    """Carry the base -> new changes over to current, keeping edits made to current elsewhere
+
+    base is what was last written to a widget, current what it holds now
+    and new the replacement. Edits (base -> current) and changes
+    (base -> new) that overlap or touch form one region; regions with a
+    change take the new lines, regions with only edits are left alone.
+    Returns (hunks, kept): hunks as from changed_hunks() but applicable to
+    current_lines, and the number of edited regions that were kept.
+    """
+    intervals = sorted(
+        [(start, end, False, (stop - first) - (end - start))
+         for start, end, first, stop in changed_hunks(base_lines, current_lines)]
+        + [(start, end, True, (stop - first) - (end - start))
+           for start, end, first, stop in changed_hunks(base_lines, new_lines)]
+    )
+    hunks = []
+    kept = 0
+    # Line count differences of current and new against base before the region being built
+    current_shift = new_shift = 0
+    index = 0
+    while index < len(intervals):
+        start, end = intervals[index][:2]
+        changed = False
+        current_delta = new_delta = 0
+        while index < len(intervals) and intervals[index][0] <= end:
+            _, interval_end, is_change, delta = intervals[index]
+            end = max(end, interval_end)
+            if is_change:
+                changed = True
+                new_delta += delta
+            else:
+                current_delta += delta
+            index += 1
+        if changed:
+            hunks.append((start + current_shift, end + current_shift + current_delta,
+                          start + new_shift, end + new_shift + new_delta))
+        else:
+            kept += 1
+        current_shift += current_delta
+        new_shift += new_delta
+    return hunks[::-1], kept
+
+
+def apply_hunks(lines, hunks, new_lines):
+    """Return lines with the hunks applied (the list form of what the GUI does in a text widget)"""
+    lines = list(lines)
+    for start, end, new_start, new_end in hunks:
+        lines[start:end] = new_lines[new_start:new_end]
+    return lines
@@ -0,0 +1,726 @@
+import re
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from braces import BraceIndex, iter_type_declarations
+from cache import content_key, types_key
+from formatter import format_go
+from importscan import GO_IMPORTS
+from profiling import PhaseTimer
+from rules import BODY_PIPELINE, CLEANUP_PIPELINE, RuleStats
+from ir import ClassDecl, FieldDecl, MethodDecl
+from sourcemap import LineCounter, SourceMap
+
+# Translation rules mapping Java concepts to Go
+TRANSLATION_RULES = {
+    # Java -> Go declarations
+    r'public class (\w+)': r'package main\n\n// \1 represents the Java class \1\ntype \1 struct {',
+    r'private (\w+) (\w+);': r'\2 \1 // private',
+    r'public (\w+) (\w+);': r'\2 \1 // public',
+    r'protected (\w+) (\w+);': r'\2 \1 // protected',
+    r'(public|private|protected)? ?static void main\(String\[\] args\)': r'func main()',
+    
+    # Function declarations
+    r'public (\w+) (\w+)\((.*?)\)': r'// \2 is the Go equivalent of the Java method\nfunc (\*this) \2(\3) \1',
+    r'private (\w+) (\w+)\((.*?)\)': r'// \2 is the Go equivalent of the Java private method\nfunc (\*this) \2(\3) \1',
+    
+    # Control structures
+    r'if \((.*?)\) \{': r'if \1 {',
+    r'else \{': r'else {',
+    r'for \((\w+) (\w+) = (\w+); \2 ([<>=!]+) (\w+); \2([\+\-]{2}|[\+\-]=\d+)\) \{': 
+        r'for \2 := \3; \2 \4 \5; \2\6 {',
+    r'while \((.*?)\) \{': r'for \1 {',
+    r'do \{': r'for {',
+    r'\} while\((.*?)\);': r'if !(\1) {\n    break\n}',
+    
+    # Variable declarations
+    r'(\w+) (\w+) = (.*?);': r'\2 := \3 // \1',
+    
+    # Common Java methods to Go
+    r'System\.out\.println\((.*?)\);': r'fmt.Println(\1)',
+    r'System\.out\.print\((.*?)\);': r'fmt.Print(\1)',
+    
+    # Imports conversion
+    r'import java\.util\..*;': r'import (\n    "fmt"\n    "time"\n    "strconv"\n    "strings"\n)',
+    r'import java\.io\..*;': r'import (\n    "io"\n    "os"\n    "bufio"\n)',
+    
+    # Error handling
+    r'try \{': r'// Go uses error handling instead of try-catch\n',
+    r'\} catch\((.*?)\) \{': r'// Error handling for \1\nif err != nil {',
+    r'throw new (\w+)\((.*?)\);': r'return fmt.Errorf("\1: %v", \2)',
+    
+    # Cleanup
+    r'\}(\s*)\}': r'}\n}',
+    r';\s*\n': '\n',
+    r'}': '}',
+}
+
+# Method and main headers up to the opening brace; bodies are found with the brace index
+METHOD_HEADER_PATTERN = re.compile(
+    r'\b(?:(public|private|protected)\s+)?(?:static\s+)?(\w+)\s+(\w+)\s*\(([^()]*)\)\s*'
+    r'(?:throws\s+[\w.]+(?:\s*,\s*[\w.]+)*\s*)?\{'
+)
+MAIN_HEADER_PATTERN = re.compile(
+    r'public\s+static\s+void\s+main\s*\(\s*String\s*\[\]\s*\w+\s*\)\s*'
+    r'(?:throws\s+[\w.]+(?:\s*,\s*[\w.]+)*\s*)?\{'
+)
+FIELD_PATTERN = re.compile(r'(private|public|protected)?\s+(\w+)\s+(\w+)(?:\s*=\s*(.*?))?;')
+PUBLIC_CLASS_PATTERN = re.compile(r'public\s+class\s+(\w+)')
+
+
+class SourcePatterns:
+    """The extraction patterns for one kind of source: str, or bytes/mmap
+
+    Scanning a memory-mapped file as bytes avoids decoding and copying all
+    of it; only the pieces that end up in the Go code go through decode().
+    Byte patterns only treat ASCII as word characters, so they are only
+    used on sources that are entirely ASCII (see is_ascii()).
+    """
+
+    def __init__(self, text):
+        self.text = text
+        patterns = (FIELD_PATTERN, PUBLIC_CLASS_PATTERN, METHOD_HEADER_PATTERN, MAIN_HEADER_PATTERN)
+        if not text:
+            patterns = tuple(re.compile(pattern.pattern.encode()) for pattern in patterns)
+        self.field, self.public_class, self.method_header, self.main_header = patterns
+        self.static = "static" if text else b"static"
+
+    def decode(self, value):
+        """Turn a matched piece of source into str"""
+        if self.text or value is None:
+            return value
+        return value.decode('utf-8', errors='replace')
+
+
+TEXT_PATTERNS = SourcePatterns(text=True)
+BYTES_PATTERNS = SourcePatterns(text=False)
+
+# Bytes checked at a time by is_ascii(), so an mmap is never copied whole
+ASCII_CHECK_CHUNK = 1024 * 1024
+
+
+def is_ascii(source):
+    """Whether a bytes or mmap source holds only ASCII"""
+    if isinstance(source, bytes):
+        return source.isascii()
+    return all(
+        source[start:start + ASCII_CHECK_CHUNK].isascii() for start in range(0, len(source), ASCII_CHECK_CHUNK)
+    )
+
+
+# Characters read at a time by translate_stream
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Classes with fewer methods are converted serially even when jobs > 1;
+# below this the pool's start-up and pickling cost more than they save
+PARALLEL_MIN_METHODS = 1000
+
+# Chunks of methods handed to each worker process, to balance uneven bodies
+PARALLEL_CHUNKS_PER_JOB = 4
+
+
+class TranslationTimeout(Exception):
+    """Raised when a translation runs past its time limit"""
+
+
+@contextmanager
+def time_limit(seconds):
+    """Abort the enclosed translation with TranslationTimeout after seconds
+
+    Uses SIGALRM, which also interrupts a regex that is stuck backtracking.
+    Where that is not available (Windows, or off the main thread) the block
+    runs without a limit.
+    """
+    if not seconds or not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise TranslationTimeout(f"timed out after {seconds}s")
+
+    previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+class TranslationOptions:
+    """Options that control how Java code is translated to Go"""
+
+    def __init__(self, keep_comments=True, use_pointers=True, capitalize_fields=True):
+        self.keep_comments = keep_comments
+        self.use_pointers = use_pointers
+        self.capitalize_fields = capitalize_fields
+
+    def as_dict(self):
+        """Return the options as a plain dict"""
+        return {
+            "keep_comments": self.keep_comments,
+            "use_pointers": self.use_pointers,
+            "capitalize_fields": self.capitalize_fields,
+        }
+
+
+def emit_method_chunk(job):
+    """Emit a run of methods of one class in a worker process
+
+    Returns the Go code of each method, in order, the number of rewrite
+    passes made and the rule statistics rows (None unless requested).
+    """
+    options, types, class_name, field_names, methods, rule_stats = job
+    engine = JavaToGoEngine(options, types=types, rule_stats=RuleStats() if rule_stats else None)
+    rewrite_fields = engine.field_rewriter(field_names)
+    method_codes = [engine.emit_method(class_name, rewrite_fields, method) for method in methods]
+    return method_codes, engine.passes, engine.rule_stats.as_rows() if rule_stats else None
+
+
+class JavaToGoEngine:
+    """Translate Java source code to Go without depending on a GUI"""
+
+    def __init__(self, options=None, progress=None, cache=None, types=None, jobs=1, rule_stats=None):
+        self.options = options or TranslationOptions()
+        # Optional UnitCache shared between translations
+        self.cache = cache
+        # {class name: kind} of user types from a project's SymbolIndex
+        self.types = types or {}
+        self.types_key = types_key(self.types) if self.types else None
+        self.translation_rules = TRANSLATION_RULES
+        # Optional callback progress(phase, done, total) used by long running callers
+        self.progress = progress
+        # Worker processes for the methods of classes with PARALLEL_MIN_METHODS or more
+        self.jobs = jobs or 1
+        # Optional RuleStats that every rewrite pass adds its matches and cost to
+        self.rule_stats = rule_stats
+        # Number of rewrite passes over the text made by the last translation
+        self.passes = 0
+        # Per-phase wall time of the last translation
+        self.timer = PhaseTimer()
+        self.total_seconds = 0.0
+        # Java line range of every Go line of the last translation
+        self.source_map = SourceMap()
+
+    def translate(self, java_code):
+        """Translate Java source code and return the generated Go code
+
+        java_code is a str, or UTF-8 bytes / an mmap that is scanned
+        without decoding it as a whole when it is all ASCII. Anything else
+        is decoded first, so the output never depends on which form the
+        source came in.
+        """
+        self.passes = 0
+        self.timer = PhaseTimer()
+        self.source_map = SourceMap()
+        start = time.perf_counter()
+        
+        # The byte patterns would miss non-ASCII identifiers
+        if not isinstance(java_code, str) and not is_ascii(java_code):
+            java_code = str(java_code, 'utf-8', 'replace')
+        
+        # Check for class definition
+        patterns = TEXT_PATTERNS if isinstance(java_code, str) else BYTES_PATTERNS
+        class_match = patterns.public_class.search(java_code)
+        class_name = patterns.decode(class_match.group(1)) if class_match else None
+        
+        unit = self.extract_units(java_code, class_name)
+        
+        # Body conversion and field rewrites are timed as their own phases inside emit
+        with self.timer.phase("emit"):
+            go_code = self.emit_code(unit)
+        
+        # Imports follow from what the emitted code actually uses
+        with self.timer.phase("imports"):
+            packages = GO_IMPORTS.packages(go_code)
+        go_code = self.emit_header(packages) + go_code
+        
+        self.total_seconds = time.perf_counter() - start
+        return go_code
+    
+    def translate_stream(self, stream, chunk_size=STREAM_CHUNK_SIZE):
+        """Translate a Java file object one top-level type at a time, yielding Go code
+
+        The output is the same as translate() on the whole text: the fields
+        of every type go into the struct of the public class, and its methods
+        follow. The file is read twice in chunks, declaration by declaration,
+        so memory use depends on the largest type rather than the size of the
+        file. The first read collects the class name, fields and main (every
+        method needs all fields for its rewrites) and the second emits the
+        methods. The output is not incremental: Go needs the import block
+        first and the imports depend on all of the emitted code, so the code
+        is spooled to a temporary file and nothing is yielded until the
+        whole input has been translated. Then the header and the spooled
+        code follow in chunk_size pieces.
+        """
+        self.passes = 0
+        self.timer = PhaseTimer()
+        self.source_map = SourceMap()
+        start = time.perf_counter()
+        
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as copy:
+            if not stream.seekable():
+                shutil.copyfileobj(stream, copy, chunk_size)
+                copy.seek(0)
+                stream = copy
+            stream_start = stream.tell()
+            
+            class_name = None
+            fields = []
+            main = None
+            for kind, name, declaration, first_line in iter_type_declarations(stream, chunk_size):
+                if class_name is None:
+                    class_match = PUBLIC_CLASS_PATTERN.search(declaration)
+                    class_name = class_match.group(1) if class_match else None
+                unit = self.extract_units(declaration, name, first_line, members=True)
+                fields += unit.fields
+                if main is None and unit.main is not None:
+                    main = unit.main.detached()
+            
+            packages = set()
+            with tempfile.TemporaryFile('w+', encoding='utf-8') as spool:
+                def emit(build, *args):
+                    with self.timer.phase("emit"):
+                        go_code = build(*args)
+                    with self.timer.phase("imports"):
+                        packages.update(GO_IMPORTS.packages(go_code))
+                    spool.write(go_code)
+                
+                unit = ClassDecl(class_name, fields, [], main)
+                if class_name and fields:
+                    emit(self.emit_mapped_struct, unit)
+                    field_names = [field.name for field in fields]
+                    rewrite_fields = self.field_rewriter(field_names)
+                    stream.seek(stream_start)
+                    for kind, name, declaration, first_line in iter_type_declarations(stream, chunk_size):
+                        methods = self.extract_units(declaration, class_name, first_line).methods
+                        if methods and not unit.methods:
+                            # Kept for the example main
+                            unit.methods = [methods[0].detached()]
+                        emit(self.emit_methods, ClassDecl(class_name, fields, methods), field_names, rewrite_fields)
+                emit(self.emit_main_unit, unit)
+                
+                yield self.emit_header(packages)
+                spool.seek(0)
+                for chunk in iter(lambda: spool.read(chunk_size), ""):
+                    yield chunk
+        self.total_seconds = time.perf_counter() - start
+    
+    def emit_header(self, imports):
+        """Emit the package clause and the import block, placed before the code already emitted"""
+        go_code = "package main\n\n"
+        
+        # Add imports if needed, in gofmt order
+        if imports:
+            go_code += 'import (\n'
+            for imp in sorted(imports):
+                go_code += f'    "{imp}"\n'
+            go_code += ')\n\n'
+        self.source_map.prepend_unmapped(go_code.count('\n'))
+        return go_code
+    
+    def extract_units(self, java_code, class_name, first_line=1, members=None):
+        """Parse the fields, methods and main of a class in java_code into a ClassDecl
+
+        Lines are counted from first_line for the source map. Fields and
+        method headers are only looked for in the stretches of the class
+        body between its members, which the brace index gives directly, so
+        method bodies are never scanned here; their text stays in the
+        source until it is emitted. They are only looked for when there is
+        a class name, unless members says otherwise.
+        """
+        patterns = TEXT_PATTERNS if isinstance(java_code, str) else BYTES_PATTERNS
+        counter = LineCounter(java_code, first_line)
+        unit = ClassDecl(class_name)
+        
+        # Brace depths are computed once and shared by the extraction phases
+        with self.timer.phase("brace_index"):
+            brace_index = BraceIndex(java_code)
+        
+        self.report_progress("Extracting members")
+        with self.timer.phase("parse"):
+            # Check if this is a simple program with main method only
+            for match in patterns.main_header.finditer(java_code):
+                unit.main = self.method_decl(java_code, match, (None, "void", "main", None), counter, brace_index)
+                if unit.main is not None:
+                    break
+            
+            if members is None:
+                members = bool(class_name)
+            if members:
+                for start, end in brace_index.spans_at_depth(1, len(java_code)):
+                    for match in patterns.field.finditer(java_code, start, end):
+                        # Skip static fields
+                        if patterns.static not in java_code[match.start()-10:match.start()]:
+                            modifier, field_type, field_name, default_value = map(patterns.decode, match.groups())
+                            unit.fields.append(FieldDecl(field_type, field_name, default_value, counter.line_at(match.start(3))))
+                    
+                    # A span ends at the next brace, so it holds at most one method header
+                    match = patterns.method_header.search(java_code, start, end)
+                    if match is None:
+                        continue
+                    signature = tuple(map(patterns.decode, match.groups()))
+                    if signature[2] == "main":  # Skip main method as it's handled differently
+                        continue
+                    method = self.method_decl(java_code, match, signature, counter, brace_index)
+                    if method is not None:
+                        unit.methods.append(method)
+        
+        return unit
+    
+    def method_decl(self, java_code, header_match, signature, counter, brace_index):
+        """MethodDecl for a matched method header, or None when its body is not closed"""
+        open_position = header_match.end() - 1
+        close_position = brace_index.closing_brace(open_position)
+        if close_position == -1:
+            return None
+        lines = (
+            counter.line_at(header_match.start()),
+            counter.line_at(open_position),
+            counter.line_at(close_position),
+        )
+        return MethodDecl(*signature, java_code, open_position + 1, close_position, lines)
+    
+    def emit_code(self, unit):
+        """Emit the struct, methods and main function of a ClassDecl
+
+        Each emitted unit is recorded in the source map.
+        """
+        go_code = ""
+        
+        # Handle structs if needed
+        if unit.name and unit.fields:
+            go_code += self.emit_mapped_struct(unit)
+            go_code += self.emit_methods(unit)
+        
+        return go_code + self.emit_main_unit(unit)
+    
+    def emit_mapped_struct(self, unit):
+        """Emit the struct of a ClassDecl, recorded in the source map against its fields"""
+        class_name, fields = unit.name, unit.fields
+        struct = self.cached_unit(
+            "fields", (class_name, [field.key() for field in fields]), lambda: self.emit_struct(class_name, fields)
+        )
+        self.source_map.add_range(struct.count('\n'), fields[0].line, fields[-1].line)
+        return struct
+    
+    def emit_methods(self, unit, field_names=None, rewrite_fields=None):
+        """Emit the methods of a ClassDecl, each recorded in the source map
+
+        field_names and rewrite_fields can be passed in when the methods of
+        one class are emitted in several calls, so they are built only once.
+        """
+        go_code = ""
+        class_name, methods = unit.name, unit.methods
+        if field_names is None:
+            field_names = [field.name for field in unit.fields]
+            rewrite_fields = self.field_rewriter(field_names)
+        prebuilt = self.emit_methods_parallel(class_name, field_names, methods)
+        for method_number, method in enumerate(methods):
+            self.report_progress("Converting methods", method_number, len(methods))
+            method_code = self.cached_unit(
+                "method", (class_name, field_names, method.key()),
+                lambda: prebuilt[method_number] if method_number in prebuilt
+                else self.emit_method(class_name, rewrite_fields, method)
+            )
+            # Comment and func line before the body, "}" and a blank line after it
+            self.source_map.add_block(method_code, 2, 2, method)
+            go_code += method_code
+        return go_code
+    
+    def emit_main_unit(self, unit):
+        """Emit the main of a ClassDecl, or an example main for a class with fields and methods"""
+        # Handle main method if it exists
+        if unit.main is not None:
+            self.report_progress("Converting main")
+            main_body = unit.main.body
+            main_code = self.cached_unit("main", (main_body,), lambda: self.emit_main(main_body))
+            self.source_map.add_block(main_code, 1, 1, unit.main, main_body)
+            return main_code
+        # If there's a class but no main, add a simple main that creates and uses the class
+        if unit.name and unit.fields and unit.methods:
+            return self.mapped_sample_main(unit)
+        return ""
+    
+    def mapped_sample_main(self, unit):
+        """emit_sample_main(), recorded in the source map against the class fields"""
+        go_code = self.emit_sample_main(unit.name, unit.fields, unit.methods)
+        self.source_map.add_range(go_code.count('\n'), unit.fields[0].line, unit.fields[-1].line)
+        return go_code
+    
+    def emit_sample_main(self, class_name, fields, methods):
+        """Emit a commented-out example of creating and using the class"""
+        go_code = "func main() {\n"
+        go_code += f"    // Example of creating and using a {class_name} instance\n"
+        go_code += f"    // Uncomment and modify as needed\n"
+        go_code += f"    // instance := New{class_name}("
+        
+        # Add sample values for constructor
+        sample_values = []
+        for field in fields:
+            sample_values.append(self.get_sample_value(field.field_type))
+        
+        go_code += ", ".join(sample_values)
+        go_code += ")\n"
+        
+        # Add a example method call if methods exist
+        if methods:
+            go_code += f"    // instance.{methods[0].name}()\n"
+        
+        go_code += "}\n"
+        return go_code
+    
+    def translation_report(self):
+        """Structured timing report for the last translation, plus the rule statistics if collected"""
+        report = {
+            "total_seconds": self.total_seconds,
+            "phases": dict(self.timer.totals),
+            "passes": self.passes,
+        }
+        if self.rule_stats is not None:
+            report["rules"] = self.rule_stats.as_rows()
+        return report
+    
+    def unit_key(self, kind, parts):
+        """Cache key of one unit"""
+        if self.types_key:
+            parts = (self.types_key,) + tuple(parts)
+        return content_key(kind, self.options, *parts)
+    
+    def cached_unit(self, kind, parts, build):
+        """Return the Go code for one unit, reusing the cached result when its source is unchanged"""
+        if self.cache is None:
+            return build()
+        key = self.unit_key(kind, parts)
+        go_code = self.cache.get(key)
+        if go_code is None:
+            go_code = build()
+            self.cache.put(key, go_code)
+        return go_code
+    
+    def emit_struct(self, class_name, fields):
+        """Emit the struct and New constructor for the class fields"""
+        go_code = f"// {class_name} represents the equivalent of Java class {class_name}\n"
+        go_code += f"type {class_name} struct {{\n"
+        for field in fields:
+            go_type = self.java_to_go_type(field.field_type)
+            go_code += f"    {self.capitalize_field(field.name)} {go_type} // was {field.field_type}\n"
+        go_code += "}\n\n"
+        
+        # Add constructor method (New function)
+        go_code += f"// New{class_name} creates a new {class_name} instance\n"
+        go_code += f"func New{class_name}("
+        
+        # Add parameters
+        param_parts = []
+        for field in fields:
+            go_type = self.java_to_go_type(field.field_type)
+            param_parts.append(f"{field.name} {go_type}")
+        
+        go_code += ", ".join(param_parts)
+        go_code += f") *{class_name} {{\n"
+        go_code += f"    return &{class_name}{{\n"
+        
+        # Add field initializations
+        for field in fields:
+            go_code += f"        {self.capitalize_field(field.name)}: {field.name},\n"
+        
+        go_code += "    }\n"
+        go_code += "}\n\n"
+        return go_code
+    
+    def field_rewriter(self, field_names):
+        """Compile the this.field -> s.Field rewrite for a class into one pass
+
+        All field names go into a single word-bounded alternation, so each
+        method body is scanned once whatever the number of fields, and
+        this.name no longer matches the start of this.nameList.
+        """
+        replacements = {field_name: f"s.{self.capitalize_field(field_name)}" for field_name in field_names}
+        alternatives = "|".join(re.escape(name) for name in sorted(replacements, key=len, reverse=True))
+        pattern = re.compile(r'\bthis\.(' + alternatives + r')\b')
+        return lambda code: pattern.sub(lambda match: replacements[match.group(1)], code)
+    
+    def emit_methods_parallel(self, class_name, field_names, methods):
+        """Emit the methods of a large class on a process pool
+
+        Returns {method index: Go code} for the methods that are not in the
+        unit cache, or an empty dict when the class is converted serially
+        (jobs == 1 or fewer than PARALLEL_MIN_METHODS methods). Methods are
+        sent in contiguous chunks and come back in order, so the result is
+        the same as emitting them one by one.
+        """
+        if self.jobs <= 1 or len(methods) < PARALLEL_MIN_METHODS:
+            return {}
+        numbers = [
+            number for number, method in enumerate(methods)
+            if self.cache is None or self.unit_key("method", (class_name, field_names, method.key())) not in self.cache
+        ]
+        if len(numbers) < PARALLEL_MIN_METHODS:
+            return {}
+        
+        self.report_progress("Converting methods", 0, len(methods))
+        chunk_size = -(-len(numbers) // (self.jobs * PARALLEL_CHUNKS_PER_JOB))
+        chunks = [numbers[start:start + chunk_size] for start in range(0, len(numbers), chunk_size)]
+        work = [
+            (self.options, self.types, class_name, field_names, [methods[number].detached() for number in chunk],
+             self.rule_stats is not None)
+            for chunk in chunks
+        ]
+        # Imported here so serial translations don't pay for multiprocessing
+        from multiprocessing import Pool
+        prebuilt = {}
+        with self.timer.phase("convert_bodies"):
+            # Leaving the with block terminates the workers, so a time limit
+            # that interrupts the translation does not leave chunks running
+            with Pool(min(self.jobs, len(work))) as pool:
+                for chunk, (method_codes, passes, rule_rows) in zip(chunks, pool.imap(emit_method_chunk, work)):
+                    prebuilt.update(zip(chunk, method_codes))
+                    self.passes += passes
+                    if rule_rows:
+                        self.rule_stats.merge(rule_rows)
+        return prebuilt
+    
+    def emit_method(self, class_name, rewrite_fields, method):
+        """Emit one MethodDecl as a Go method on the class struct"""
+        method_name, params = method.name, method.params
+        go_return_type = self.java_to_go_type(method.return_type)
+        
+        # Convert parameters to Go style
+        go_params = ""
+        if params.strip():
+            param_parts = []
+            for param in params.split(","):
+                param = param.strip()
+                if param:
+                    param_parts_split = param.split()
+                    if len(param_parts_split) >= 2:
+                        param_type, param_name = param_parts_split[0], param_parts_split[1]
+                        param_parts.append(f"{param_name} {self.java_to_go_type(param_type)}")
+            go_params = ", ".join(param_parts)
+        
+        # Convert method body
+        go_body = method.body
+        
+        # Replace this.field with s.Field
+        with self.timer.phase("field_rewrite"):
+            go_body = rewrite_fields(go_body)
+        
+        # Replace other Java-isms
+        go_body = self.convert_java_body_to_go(go_body)
+        
+        # Add method
+        go_code = f"// {method_name} is the Go equivalent of the Java method\n"
+        if go_return_type != "":
+            go_code += f"func (s *{class_name}) {method_name}({go_params}) {go_return_type} {{\n"
+        else:
+            go_code += f"func (s *{class_name}) {method_name}({go_params}) {{\n"
+        
+        # Add method body with indentation
+        for line in go_body.strip().split("\n"):
+            if line.strip():
+                go_code += f"    {line.strip()}\n"
+        
+        go_code += "}\n\n"
+        return go_code
+    
+    def emit_main(self, main_body):
+        """Emit the Java main method as the Go main function"""
+        # Translate the main body
+        main_body = self.convert_java_body_to_go(main_body.strip())
+        
+        # Create the main function in Go
+        go_code = "func main() {\n"
+        
+        # Add each line of the translated body with proper indentation
+        for line in main_body.split('\n'):
+            if line.strip():  # Skip empty lines
+                go_code += f"    {line.strip()}\n"
+        
+        go_code += "}\n"
+        return go_code
+    
+    def report_progress(self, phase, done=0, total=0):
+        """Tell the progress callback, if any, which phase is running"""
+        if self.progress is not None:
+            self.progress(phase, done, total)
+    
+    def java_to_go_type(self, java_type):
+        """Convert Java type to Go type"""
+        type_map = {
+            "int": "int",
+            "long": "int64",
+            "float": "float32",
+            "double": "float64",
+            "boolean": "bool",
+            "String": "string",
+            "char": "rune",
+            "byte": "byte",
+            "short": "int16",
+            "void": "",
+            "Object": "interface{}",
+            "Integer": "int",
+            "Double": "float64",
+            "Boolean": "bool",
+            "Character": "rune"
+        }
+        
+        if java_type in type_map:
+            return type_map[java_type]
+        
+        # Classes from other files of the project are structs, used by pointer if enabled
+        if self.types.get(java_type) == "class" and self.options.use_pointers:
+            return "*" + java_type
+        return java_type
+    
+    def capitalize_field(self, field_name):
+        """Capitalize the first letter of a field name for Go exported fields"""
+        if not field_name:
+            return field_name
+        
+        # Only capitalize if the option is enabled
+        if self.options.capitalize_fields:
+            return field_name[0].upper() + field_name[1:]
+        return field_name
+    
+    def get_sample_value(self, java_type):
+        """Return a sample value for the given Java type"""
+        type_samples = {
+            "int": "0",
+            "long": "0",
+            "float": "0.0",
+            "double": "0.0",
+            "boolean": "false",
+            "String": '""',
+            "char": "'a'",
+            "byte": "0",
+            "short": "0",
+            "Integer": "0",
+            "Double": "0.0",
+            "Boolean": "false"
+        }
+        
+        if java_type not in type_samples and self.types.get(java_type) == "class" and not self.options.use_pointers:
+            return java_type + "{}"
+        return type_samples.get(java_type, "nil")
+    
+    def convert_java_body_to_go(self, java_body):
+        """Convert Java code body to Go"""
+        with self.timer.phase("convert_bodies"):
+            go_body, passes = BODY_PIPELINE.apply(java_body, self.rule_stats)
+        self.passes += passes
+        return go_body
+    
+    def cleanup_code(self, code):
+        """Clean up the translated code to make it more idiomatic Go"""
+        code, passes = CLEANUP_PIPELINE.apply(code, self.rule_stats)
+        self.passes += passes
+        return code
+    
+    def format_go(self, go_code):
+        """Apply basic brace-based indentation to Go code"""
+        return format_go(go_code)